@@ -1,55 +1,190 @@
-from io import BytesIO
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import BinaryIO, Literal, Optional
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 from PIL import Image as PILImage
 from app.api.v1.responses.image import upload_image_response
-from app.crud.image import create_image
+from app.constants.image_path import DERIVATIVES_ENABLED, UPLOAD_DEDUP, UPLOAD_MAX_BYTES, UPLOAD_MAX_PIXELS, UPLOAD_PERCEPTUAL_DEDUP
+from app.core.executor import run_blocking
+from app.crud.image import create_image, read_image_by_content_hash, read_image_by_filename, read_image_by_perceptual_hash
 from app.db import get_db
 from app.schemas.image import ImageCreate, ImageRead
+from app.tasks.derivatives import make_derivatives
 
-from app.utils.storage import Target, build_storage
+from app.utils import image_hash
+from app.utils.derivatives import derivative_filename, is_derivative_filename, pick_width
+from app.utils.image_encoding import encode_image, keepable_extension, policy_for
+from app.utils.storage import Target, build_async_storage
 
 
 router = APIRouter()
-storage = build_storage()
+storage = build_async_storage()
 
 def pick_target(filename: str) -> Target:
+  # 파생 이미지(합성 결과의 파생 포함)도 images에 등록되므로 파일명으로 직접 요청될 수 있음
+  if is_derivative_filename(filename):
+    return "derived"
   return "compose" if "composed_" in filename else "upload"
 
+# images 행은 삭제되지 않으므로 한 번 확인된 파일명은 프로세스 메모리에 기억해 DB 조회도 생략
+_KNOWN_IMAGES: "OrderedDict[str, None]" = OrderedDict()
+_KNOWN_IMAGES_MAX = 100000
+
+async def image_exists(db: AsyncSession, filename: str) -> bool:
+  """스토리지(S3 head_object) 대신 images 테이블로 존재 여부 확인. 없는 경우는 캐시하지 않음 (생성 중일 수 있음)."""
+  if filename in _KNOWN_IMAGES:
+    _KNOWN_IMAGES.move_to_end(filename)
+    return True
+  if not await read_image_by_filename(db, filename):
+    return False
+  _KNOWN_IMAGES[filename] = None
+  if len(_KNOWN_IMAGES) > _KNOWN_IMAGES_MAX:
+    _KNOWN_IMAGES.popitem(last=False)
+  return True
+
+# 디코드 전에 파일 헤더(매직 바이트)로 이미지 여부를 먼저 확인
+_IMAGE_SIGNATURES = {
+  b"\x89PNG\r\n\x1a\n": "PNG",
+  b"\xff\xd8\xff": "JPEG",
+  b"GIF87a": "GIF",
+  b"GIF89a": "GIF",
+  b"BM": "BMP",
+  b"II*\x00": "TIFF",
+  b"MM\x00*": "TIFF",
+}
+
+def sniff_image_format(head: bytes) -> Optional[str]:
+  if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+    return "WEBP"
+  for signature, fmt in _IMAGE_SIGNATURES.items():
+    if head.startswith(signature):
+      return fmt
+  return None
+
+class ImageTooLarge(Exception):
+  pass
+
+@dataclass
+class PreparedUpload:
+  data: bytes
+  extension: str
+  perceptual_hash: Optional[str]
+
+def _prepare_upload(fp: BinaryIO) -> PreparedUpload:
+  """
+  스풀된 업로드 파일을 검사하고 저장할 바이트를 준비 (스레드 풀에서 실행).
+  upload 인코딩 정책이 keep_original이고 이미 표시 가능한 형식이면 재인코딩 없이 원본 바이트를 그대로 사용.
+  지각 해시는 전체 디코드가 필요하므로 지각 중복 제거가 켜져 있을 때만 계산 (꺼져 있으면 None -> NULL 저장).
+  """
+  policy = policy_for("upload")
+  use_perceptual = UPLOAD_DEDUP and UPLOAD_PERCEPTUAL_DEDUP
+  fp.seek(0)
+  with PILImage.open(fp) as src:
+    width, height = src.size  # 헤더만 읽은 상태 -> 픽셀 수를 디코드 전에 검사
+    if width * height > UPLOAD_MAX_PIXELS:
+      raise ImageTooLarge()
+
+    extension = keepable_extension(src) if policy.keep_original else None
+    if extension:
+      # 형식과 무관하게 같은 해시가 나오도록 전체 디코드 후 계산 (JPEG draft 축소 디코드는 다른 값이 나옴)
+      perceptual_hash = image_hash.perceptual_hash(src) if use_perceptual else None
+      fp.seek(0)
+      return PreparedUpload(data=fp.read(), extension=extension, perceptual_hash=perceptual_hash)
+
+    img = src.convert("RGBA")
+  data, extension = encode_image(img, policy)
+  perceptual_hash = image_hash.perceptual_hash(img) if use_perceptual else None
+  return PreparedUpload(data=data, extension=extension, perceptual_hash=perceptual_hash)
+
 @router.get(
   "/{filename}",
-  summary="png 이미지 제공",
+  summary="이미지 제공",
+  description=
+    f"""
+      저장된 이미지를 반환합니다.<br>
+      width를 지정하면 해당 너비 이상인 가장 작은 파생 이미지(webp/jpeg)를 반환합니다.
+      파생 이미지가 아직 생성되지 않았다면 원본을 반환합니다.
+    """,
   status_code=status.HTTP_200_OK,
 )
-async def get_image(filename: str):
+async def get_image(
+  request: Request,
+  filename: str,
+  width: int | None = Query(None, gt=0, description="미리보기 등에 필요한 최대 너비(px)"),
+  fmt: Literal["webp", "jpeg"] = Query("webp", alias="format", description="파생 이미지 형식"),
+  db: AsyncSession = Depends(get_db),
+):
   target = pick_target(filename)
+  if_none_match = request.headers.get("if-none-match")
+  if not await image_exists(db, filename):
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="파일을 찾을 수 없습니다.")
+
+  # 파생 이미지를 직접 요청한 경우에는 다시 파생 이미지를 찾지 않음
+  derived_width = pick_width(width) if width and target != "derived" else None
+  if derived_width:
+    derived_filename = derivative_filename(filename, derived_width, fmt)
+    if await image_exists(db, derived_filename):
+      return await storage.get_image_response(derived_filename, "derived", if_none_match)
+    # 파생 이미지 생성 전 임시로 원본을 주는 것이므로 같은 URL이 immutable로 캐시되지 않게 함
+    response = await storage.get_image_response(filename, target)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
-  return storage.get_image_response(filename, target)
+  return await storage.get_image_response(filename, target, if_none_match)
 
 @router.post(
   "", 
   summary="이미지 업로드", 
-  description="이미지를 업로드하고 저장된 파일의 이름을 반환합니다.",
+  description="이미지를 업로드하고 저장된 파일의 이름을 반환합니다. 이미 업로드된 것과 같은 이미지면 기존 이미지 정보를 반환합니다.",
   response_model=ImageRead,
   responses=upload_image_response(),
   status_code=201
 )
 async def upload_image(file: UploadFile, db: AsyncSession = Depends(get_db)):
+  # 본문 상한은 UploadSizeLimitMiddleware가 수신 단계에서 강제, 여기서는 스풀된 크기를 한 번 더 확인
+  if file.size is not None and file.size > UPLOAD_MAX_BYTES:
+    raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="업로드 용량 초과")
+
+  head = await file.read(16)
+  if not sniff_image_format(head):
+    raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail="지원하지 않는 이미지 형식")
+
   try:
-    # PNG로 변환
-    content = await file.read()
-    pil_img = PILImage.open(BytesIO(content)).convert("RGBA")
+    # 1. 바이트 단위로 같은 파일이 이미 있으면 디코드 없이 기존 이미지 재사용
+    content_hash = await run_blocking(image_hash.content_hash, file.file)
+    if UPLOAD_DEDUP:
+      existing = await read_image_by_content_hash(db, content_hash)
+      if existing:
+        return existing
+
+    # 2. 검사 + 저장할 바이트 준비 (디코드/인코딩은 이벤트 루프 밖에서)
+    prepared = await run_blocking(_prepare_upload, file.file)
+
+    # 3. (선택) 재인코딩 등으로 바이트만 다르고 눈으로 같은 이미지면 기존 이미지 재사용
+    perceptual_hash = prepared.perceptual_hash
+    if perceptual_hash is not None:
+      existing = await read_image_by_perceptual_hash(db, perceptual_hash)
+      if existing:
+        return existing
+
+    filename = f"{str(uuid.uuid4())}.{prepared.extension}"
+    await storage.save_bytes(prepared.data, filename, target="upload")
 
-    filename = f"{str(uuid.uuid4())}.png"
+    image_in = ImageCreate(filename=filename, content_hash=content_hash, perceptual_hash=perceptual_hash)
+    created_image = await create_image(db, image_in=image_in)
 
-    storage.save_png(pil_img, filename, target="upload")
+    # 4. 썸네일/웹용 파생 이미지는 백그라운드에서 생성
+    if DERIVATIVES_ENABLED:
+      make_derivatives.delay(filename, "upload")
 
-    image_in = ImageCreate(filename=filename)
-    return await create_image(db, image_in=image_in)
+    return created_image
 
   except HTTPException:
     raise
+  except (ImageTooLarge, PILImage.DecompressionBombError):
+    raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="이미지 해상도 초과")
   except Exception as e:
       print(f"[upload_image] error: {e}")
       raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="이미지 처리 실패")
@@ -1,13 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+from typing import Any, AsyncIterator, Dict
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from redis.asyncio.client import PubSub
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.image import read_image_by_id
 from app.crud.service import read_service_by_id
 from app.db import get_db
+from app.models.enums.service import ServiceStatus
 from app.schemas.service import ServiceDetail
+from app.utils.redis_client import get_async_redis
+from app.utils.service_events import make_service_event, service_channel
 
 router = APIRouter()
 
+# 프록시 idle timeout(60s)보다 짧게 주석 이벤트를 보내 연결 유지
+SSE_KEEPALIVE_SECONDS = 15.0
+_TERMINAL_STATUSES = {ServiceStatus.COMPLETED.value, ServiceStatus.FAILED.value}
+
 @router.get(
   "/{service_id}",
   summary="해당 Service 정보 조회",
@@ -47,3 +59,59 @@ async def get_service_by_id(service_id: str, db: AsyncSession = Depends(get_db))
   )
 
   return serviceDetail
+
+def _format_sse(event: Dict[str, Any]) -> str:
+  return f"event: status\ndata: {json.dumps(event)}\n\n"
+
+async def _service_event_stream(request: Request, pubsub: PubSub, initial: Dict[str, Any]) -> AsyncIterator[str]:
+  try:
+    yield _format_sse(initial)
+    if initial["status"] in _TERMINAL_STATUSES:
+      return
+
+    while not await request.is_disconnected():
+      message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=SSE_KEEPALIVE_SECONDS)
+      if message is None:
+        yield ": keep-alive\n\n"
+        continue
+
+      event = json.loads(message["data"])
+      yield _format_sse(event)
+      if event["status"] in _TERMINAL_STATUSES:
+        return
+  finally:
+    await pubsub.unsubscribe()
+    await pubsub.aclose()
+
+@router.get(
+  "/{service_id}/events",
+  summary="서비스 진행 상태 스트림 (SSE)",
+  description=
+    f"""
+    ID와 일치하는 서비스의 step/status 변경을 Server-Sent Events로 전달합니다.<br>
+    연결 직후 현재 상태를 1회 전송하고, 이후 OCR/번역/합성 작업이 상태를 바꿀 때마다 <code>status</code> 이벤트를 전송합니다.<br>
+    COMPLETED 또는 FAILED 상태가 되면 스트림이 종료됩니다.
+    """,
+  status_code=status.HTTP_200_OK,
+  response_class=StreamingResponse,
+)
+async def stream_service_events(service_id: str, request: Request, db: AsyncSession = Depends(get_db)):
+  service_id_num = int(service_id)
+
+  # 1. 현재 상태를 읽기 전에 먼저 구독해 그 사이 발생한 이벤트를 놓치지 않음
+  pubsub = get_async_redis().pubsub()
+  await pubsub.subscribe(service_channel(service_id_num))
+
+  # 2. 서비스 조회 & 유효성 검사
+  service = await read_service_by_id(db, service_id_num)
+  if not service:
+    await pubsub.unsubscribe()
+    await pubsub.aclose()
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="존재하지 않는 서비스입니다.")
+
+  initial = make_service_event(service.id, service.step, service.status)
+  return StreamingResponse(
+    _service_event_stream(request, pubsub, initial),
+    media_type="text/event-stream",
+    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+  )
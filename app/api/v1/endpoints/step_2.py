@@ -1,9 +1,12 @@
+import asyncio
+from pathlib import Path
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.responses.step_2 import delete_area_response, get_service_detecting_status_response, make_areas_response, patch_area_origin_text_response
-from app.crud.area import create_areas_bulk, delete_area_by_id, read_area_by_id, read_areas_bulk_by_service_id, update_area
+from app.constants.image_path import OCR_REUSE_RESULTS, STORE_CROP_IMAGES
+from app.crud.area import create_areas_bulk, delete_area_by_id, read_area_by_id, read_areas_bulk_by_service_id, read_reusable_ocr_texts, update_area
 from app.crud.image import create_image, read_image_by_id
 from app.crud.service import read_service_by_id, update_service
 from app.db import get_db
@@ -12,10 +15,11 @@ from app.schemas.area import AreaCreate, AreaReadAfterDetecting, AreaUpdate, Pat
 from app.schemas.image import ImageCreate, ImageRead
 from app.schemas.service import GetServiceDetectingStatusResponse, ServiceUpdate
 from app.tasks.ocr import AreaPayload, extract_areas
-from app.utils.storage import build_storage
+from app.utils.service_events import publish_service_event_async
+from app.utils.storage import build_async_storage
 
 router = APIRouter()
-storage = build_storage()
+storage = build_async_storage()
 
 @router.post(
   "/areas", 
@@ -23,7 +27,8 @@ storage = build_storage()
   description=
     f"""
       ID와 일치하는 서비스에 바운딩 박스(영역)을 생성합니다.<br>
-      (비동기) 영역별로 텍스트 감지(OCR) 모델을 가동합니다.
+      (비동기) 영역별로 텍스트 감지(OCR) 모델을 가동합니다.<br>
+      같은 이미지/언어로 이전에 OCR한 영역(좌표 동일)은 결과를 재사용하며, 모두 재사용되면 바로 PENDING 상태가 됩니다.
     """,
   status_code=status.HTTP_202_ACCEPTED,
   responses=make_areas_response()
@@ -40,53 +45,69 @@ async def make_areas(request: PostAreaRequest, db: AsyncSession = Depends(get_db
   if service.step != ServiceStep.BOUNDING:
     raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"이미 영역을 생성한 서비스입니다.")
   
-  # 2. 잘라낸 이미지 저장
+  # 2. 원본 이미지 조회 (crop PNG 저장은 STORE_CROP_IMAGES=true 일 때만)
   originImage = await read_image_by_id(db, service.origin_image_id)
   if not originImage:
     raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="서버 오류가 발생하였습니다.")
   
-  cropped_images: List[ImageRead] = []
-  originImageFile = storage.load_image(originImage.filename, "upload")
+  cropped_images: List[ImageRead | None] = [None] * len(request.areas)
+  if STORE_CROP_IMAGES:
+    originImageFile = await storage.load_image(originImage.filename, "upload")
 
-  for i, area in enumerate(request.areas):
-    cropped = originImageFile.crop((area.x1, area.y1, area.x2, area.y2))
+    # 같은 원본 이미지를 여러 서비스가 공유할 수 있으므로 서비스 id를 포함 (확장자는 crop 인코딩 정책에 따라 결정)
+    origin_stem = Path(originImage.filename).stem
+    cropped_filenames = await asyncio.gather(*[
+      storage.save_image(originImageFile.crop((area.x1, area.y1, area.x2, area.y2)), f'{origin_stem}_{service.id}_{i+1}', target="crop")
+      for i, area in enumerate(request.areas)
+    ])
 
-    cropped_filename = f'{originImage.filename[:-4]}_{i+1}.png'
-    storage.save_png(cropped, cropped_filename, target="crop")
+    for i, cropped_filename in enumerate(cropped_filenames):
+      cropped_images[i] = await create_image(db, image_in=ImageCreate(filename=cropped_filename))
 
-    image_db = await create_image(db, image_in=ImageCreate(filename=cropped_filename))
-    cropped_images.append(image_db)
+  # 3. 같은 이미지/언어로 이미 OCR한 영역이 있으면 그 결과를 재사용
+  reusable = await read_reusable_ocr_texts(db, originImage.id, service.origin_language, service.id) if OCR_REUSE_RESULTS else {}
 
-  # 3. 영역(바운딩 박스) DB 기록
+  # 4. 영역(바운딩 박스) DB 기록
   areas_in = [AreaCreate(
     x1=area.x1,
     x2=area.x2,
     y1=area.y1,
     y2=area.y2,
     service_id=request.service_id,
-    area_image_id=cropped_images[i].id,
-  ) for i, area in enumerate(request.areas)]
+    area_image_id=cropped.id if cropped else None,
+    origin_text=reusable.get((area.x1, area.y1, area.x2, area.y2)),
+    ocr_text=reusable.get((area.x1, area.y1, area.x2, area.y2)),
+  ) for area, cropped in zip(request.areas, cropped_images)]
 
   areas = await create_areas_bulk(db, areas_in)
+  pending_areas = [area for area in areas if area.origin_text is None]
 
-  # 4. 서비스 step 전환
+  # 5. 서비스 step 전환 (모든 영역을 재사용했다면 OCR 없이 바로 완료 대기 상태로)
   service_in = ServiceUpdate(
     step=ServiceStep.DETECTING,
-    status=ServiceStatus.PROCESSING,
+    status=ServiceStatus.PROCESSING if pending_areas else ServiceStatus.PENDING,
   )
   updated_service = await update_service(db=db, id=service.id, service_in=service_in)
 
-  # 5. OCR 진행
+  if not pending_areas:
+    await publish_service_event_async(service.id, ServiceStep.DETECTING, ServiceStatus.PENDING, done=len(areas), total=len(areas))
+    return updated_service
+  await publish_service_event_async(service.id, ServiceStep.DETECTING, ServiceStatus.PROCESSING, done=len(areas) - len(pending_areas), total=len(areas))
+
+  # 6. 남은 영역만 OCR 진행 (워커가 원본을 한 번만 읽고 영역별로 메모리에서 잘라 사용)
   payloads: List[AreaPayload] = []
-  for i, area in enumerate(areas):
+  for area in pending_areas:
     area_pay_load = AreaPayload(
       area_id=area.id,
-      filename=cropped_images[i].filename,
       lang=service.origin_language.value,
+      x1=area.x1,
+      y1=area.y1,
+      x2=area.x2,
+      y2=area.y2,
     )
     payloads.append(area_pay_load)
 
-  extract_areas.delay(payloads, service.id)
+  extract_areas.delay(payloads, service.id, originImage.filename, reused=len(areas) - len(pending_areas))
 
   return updated_service
   
@@ -96,9 +117,10 @@ async def make_areas(request: PostAreaRequest, db: AsyncSession = Depends(get_db
   description=
     f"""
       ID와 일치하는 서비스의 OCR 완료 여부 및 영역 정보와 감지된 텍스트를 반환합니다.<br>
+      OCR 진행 중(PROCESSING)에도 지금까지 완료된 영역과 진행률(done/total)을 반환합니다.<br>
       <h3>Response 중 Optional 항목</h3>
       <ui>
-        <li><strong>areas</strong>: PENDING(완료 후 대기) 상태가 아니라면 null</li>
+        <li><strong>areas</strong>: PENDING(완료 후 대기) 상태가 아니라면 OCR이 끝난 영역만 포함</li>
       </ui>
     """,
   status_code=status.HTTP_200_OK,
@@ -115,35 +137,31 @@ async def get_service_detecting_status(service_id: str, db: AsyncSession = Depen
   if service.step != ServiceStep.DETECTING:
     raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"DETECTING(OCR) 단계가 아닌 서비스입니다.")
 
-  # 2. 서비스 완료 여부 검사 및 반환
-  if service.status == ServiceStatus.PENDING: # OCR이 완료되고 다음 입력을 기다리는 상태
-    areas = await read_areas_bulk_by_service_id(db, service_id_num)
-    areas_after_detecting = [
-      AreaReadAfterDetecting(
-        id=area.id,
-        created_at=area.created_at,
-        service_id=area.service_id,
-        x1=area.x1,
-        x2=area.x2,
-        y1=area.y1,
-        y2=area.y2,
-        origin_text=area.origin_text or "error",
-      ) for area in areas
-    ]
-
-    return GetServiceDetectingStatusResponse(
-      isCompleted=True,
-      id=service_id_num,
-      status=service.status,
-      areas=areas_after_detecting
-    )
-  else:
-    return GetServiceDetectingStatusResponse(
-      isCompleted=False,
-      id=service_id_num,
-      status=service.status,
-      areas=None
-    )
+  # 2. 서비스 완료 여부 검사 및 반환 (진행 중이면 OCR이 끝난 영역만)
+  is_completed = service.status == ServiceStatus.PENDING # OCR이 완료되고 다음 입력을 기다리는 상태
+  areas = await read_areas_bulk_by_service_id(db, service_id_num)
+  done_areas = [area for area in areas if is_completed or area.origin_text is not None]
+  areas_after_detecting = [
+    AreaReadAfterDetecting(
+      id=area.id,
+      created_at=area.created_at,
+      service_id=area.service_id,
+      x1=area.x1,
+      x2=area.x2,
+      y1=area.y1,
+      y2=area.y2,
+      origin_text=area.origin_text or "error",
+    ) for area in done_areas
+  ]
+
+  return GetServiceDetectingStatusResponse(
+    isCompleted=is_completed,
+    id=service_id_num,
+    status=service.status,
+    areas=areas_after_detecting,
+    done=len(done_areas),
+    total=len(areas),
+  )
   
 @router.patch(
   "/area/{service_id}/{area_id}", 
@@ -10,6 +10,7 @@ from app.schemas.area import AreaReadAfterTranslating, AreaUpdate, PatchAreaTran
 from app.schemas.service import GetServiceTranslatingStatusResponse, PostServiceTranslateRequest, ServiceUpdate
 from app.tasks.translate import TranslatePayload, translate_areas
 from app.utils.enum_to_html import enum_to_html
+from app.utils.service_events import publish_service_event_async
 
 router = APIRouter()
 
@@ -43,6 +44,7 @@ async def make_service_to_translating_mode(request: PostServiceTranslateRequest,
     target_language=request.target_language,
   )
   updated_service = await update_service(db=db, id=service.id, service_in=service_in)
+  await publish_service_event_async(service.id, ServiceStep.TRANSLATING, ServiceStatus.PROCESSING)
 
   # 3. 번역 진행
   payload = TranslatePayload(
@@ -61,9 +63,10 @@ async def make_service_to_translating_mode(request: PostServiceTranslateRequest,
   description=
     f"""
       ID와 일치하는 서비스의 번역 완료 여부 및 영역 정보와 감지된 텍스트 & 번역된 텍스트를 반환합니다.<br>
+      번역 진행 중(PROCESSING)에도 지금까지 번역된 영역과 진행률(done/total)을 반환합니다.<br>
       <h3>Response 중 Optional 항목</h3>
       <ui>
-        <li><strong>areas</strong>: PENDING(완료 후 대기) 상태가 아니라면 null</li>
+        <li><strong>areas</strong>: PENDING(완료 후 대기) 상태가 아니라면 번역이 끝난 영역만 포함</li>
       </ui>
     """,
   status_code=status.HTTP_200_OK,
@@ -80,36 +83,32 @@ async def get_service_translating_status(service_id: str, db: AsyncSession = Dep
   if service.step != ServiceStep.TRANSLATING:
     raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"TRANSLATING 단계가 아닌 서비스입니다.")
 
-  # 2. 서비스 완료 여부 검사 및 반환
-  if service.status == ServiceStatus.PENDING: # OCR이 완료되고 다음 입력을 기다리는 상태
-    areas = await read_areas_bulk_by_service_id(db, service_id_num)
-    areas_after_detecting = [
-      AreaReadAfterTranslating(
-        id=area.id,
-        created_at=area.created_at,
-        service_id=area.service_id,
-        x1=area.x1,
-        x2=area.x2,
-        y1=area.y1,
-        y2=area.y2,
-        origin_text=area.origin_text or "error",
-        translated_text=area.translated_text or "error",
-      ) for area in areas
-    ]
-
-    return GetServiceTranslatingStatusResponse(
-      isCompleted=True,
-      id=service_id_num,
-      status=service.status,
-      areas=areas_after_detecting
-    )
-  else:
-    return GetServiceTranslatingStatusResponse(
-      isCompleted=False,
-      id=service_id_num,
-      status=service.status,
-      areas=None
-    )
+  # 2. 서비스 완료 여부 검사 및 반환 (진행 중이면 번역이 끝난 영역만)
+  is_completed = service.status == ServiceStatus.PENDING # 번역이 완료되고 다음 입력을 기다리는 상태
+  areas = await read_areas_bulk_by_service_id(db, service_id_num)
+  done_areas = [area for area in areas if is_completed or area.translated_text is not None]
+  areas_after_detecting = [
+    AreaReadAfterTranslating(
+      id=area.id,
+      created_at=area.created_at,
+      service_id=area.service_id,
+      x1=area.x1,
+      x2=area.x2,
+      y1=area.y1,
+      y2=area.y2,
+      origin_text=area.origin_text or "error",
+      translated_text=area.translated_text or "error",
+    ) for area in done_areas
+  ]
+
+  return GetServiceTranslatingStatusResponse(
+    isCompleted=is_completed,
+    id=service_id_num,
+    status=service.status,
+    areas=areas_after_detecting,
+    done=len(done_areas),
+    total=len(areas),
+  )
 
 @router.patch(
   "/area/{service_id}/{area_id}", 
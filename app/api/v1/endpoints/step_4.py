@@ -8,6 +8,7 @@ from app.db import get_db
 from app.models.enums.service import ServiceStep, ServiceStatus
 from app.schemas.service import GetServiceComposingStatusResponse, ServiceUpdate
 from app.tasks.compose import ComposePayload, compose_image
+from app.utils.service_events import publish_service_event_async
 
 router = APIRouter()
 
@@ -38,6 +39,7 @@ async def make_service_to_composing_mode(service_id: str, db: AsyncSession = Dep
     status=ServiceStatus.PROCESSING,
   )
   updated_service = await update_service(db=db, id=service.id, service_in=service_in)
+  await publish_service_event_async(service.id, ServiceStep.COMPOSING, ServiceStatus.PROCESSING)
 
   # 3. 합성 진행
   payload = ComposePayload(
@@ -16,6 +16,26 @@ def upload_image_response() -> Dict[int | str, Dict[str, Any]]:
         }
       }
     },
+    status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {
+      "description": "업로드 용량 또는 해상도 초과",
+      "content": {
+        "application/json": {
+          "example": {
+            "detail": "업로드 용량 초과"
+          }
+        }
+      }
+    },
+    status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {
+      "description": "이미지가 아닌 파일",
+      "content": {
+        "application/json": {
+          "example": {
+            "detail": "지원하지 않는 이미지 형식"
+          }
+        }
+      }
+    },
     status.HTTP_500_INTERNAL_SERVER_ERROR: {
       "description": "이미지 처리 실패",
       "content": {
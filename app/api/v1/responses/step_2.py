@@ -93,7 +93,9 @@ def get_service_detecting_status_response() -> Dict[int | str, Dict[str, Any]]:
                     "serviceId": 10,
                     "originText": "南北線"
                 }
-            ]
+            ],
+            "done": 3,
+            "total": 3
         } 
         }
       }
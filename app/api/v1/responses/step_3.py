@@ -44,7 +44,9 @@ def get_service_translating_status_response() -> Dict[int | str, Dict[str, Any]]
                     "originText": "南北線",
                     "translatedText": "남북선"
                 }
-            ]
+            ],
+            "done": 3,
+            "total": 3
         } 
         }
       }
@@ -11,7 +11,7 @@ def get_service_composing_status_response() -> Dict[int | str, Dict[str, Any]]:
             "isCompleted": True,
             "id": 10,
             "status": "PENDING",
-            "composedImageFilename": "composed_e61272c0-36f4-4453-b699-24907e049199.png"
+            "composedImageFilename": "composed_12_e61272c0-36f4-4453-b699-24907e049199.png"
           }
         }
       }
@@ -14,5 +14,9 @@ celery = Celery(
     "app.tasks.ocr",
     "app.tasks.translate",
     "app.tasks.compose",
+    "app.tasks.derivatives",
   ]
-)
\ No newline at end of file
+)
+
+# 자식 프로세스가 worker_process_init(OCR 예열 추론)을 마칠 때까지 기다리는 시간 (기본 4초로는 예열 중 자식이 종료됨)
+celery.conf.worker_proc_alive_timeout = float(os.getenv("CELERY_WORKER_PROC_ALIVE_TIMEOUT") or "120")
\ No newline at end of file
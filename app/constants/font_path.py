@@ -0,0 +1,2 @@
+# 이미지 합성 > 기계 번역 때 사용할 폰트
+MACHINE_FONT_PATH = './font/PretendardJP-Regular.ttf'
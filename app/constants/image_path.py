@@ -1,5 +1,39 @@
-# ./photo/origin, ./photo/crop, ./photo/compose
+import os
+
+# ./photo/origin, ./photo/crop, ./photo/compose, ./photo/derived
 IMAGE_BASE_DIR = 'photo'
 UPLOAD_DIR = 'origin'
 CROP_DIR = 'crop'
-COMPOSE_DIR = 'compose'
\ No newline at end of file
+COMPOSE_DIR = 'compose'
+DERIVED_DIR = 'derived'  # 썸네일/웹 최적화 파생 이미지
+
+# 영역별 crop PNG 저장 여부 (OCR은 원본에서 직접 잘라 쓰므로 기본값은 저장 안 함)
+STORE_CROP_IMAGES = (os.getenv("STORE_CROP_IMAGES") or "false").lower() == "true"
+
+# 업로드 제한: 요청 본문 최대 바이트, 디코드 허용 최대 픽셀 수 (압축 폭탄 방지)
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES") or str(20 * 1024 * 1024))
+UPLOAD_MAX_PIXELS = int(os.getenv("UPLOAD_MAX_PIXELS") or "50000000")
+
+# 업로드 중복 제거: 같은 바이트(SHA-256)면 기존 이미지 재사용, PERCEPTUAL이면 눈으로 같은 이미지(dHash)도 재사용
+UPLOAD_DEDUP = (os.getenv("UPLOAD_DEDUP") or "true").lower() == "true"
+UPLOAD_PERCEPTUAL_DEDUP = (os.getenv("UPLOAD_PERCEPTUAL_DEDUP") or "false").lower() == "true"
+
+# 같은 이미지/언어로 이전에 OCR한 영역(좌표 동일)이 있으면 결과를 재사용하고 OCR을 생략
+OCR_REUSE_RESULTS = (os.getenv("OCR_REUSE_RESULTS") or "true").lower() == "true"
+
+# 파생 이미지(썸네일/웹용): 업로드/합성 후 백그라운드로 너비별 생성
+DERIVATIVES_ENABLED = (os.getenv("DERIVATIVES_ENABLED") or "true").lower() == "true"
+DERIVATIVE_WIDTHS = sorted({int(w) for w in (os.getenv("DERIVATIVE_WIDTHS") or "320,640,1280").split(",") if w.strip()})
+DERIVATIVE_FORMATS = [f.strip().lower() for f in (os.getenv("DERIVATIVE_FORMATS") or "webp,jpeg").split(",") if f.strip()]
+DERIVATIVE_QUALITY = int(os.getenv("DERIVATIVE_QUALITY") or "80")
+
+# 이미지 응답 캐시 정책 (파일명은 한 번 쓰이면 바뀌지 않으므로 기본 1년 immutable)
+IMAGE_CACHE_CONTROL = os.getenv("IMAGE_CACHE_CONTROL") or "public, max-age=31536000, immutable"
+# 지정 시(예: /_protected_images) 로컬 파일 전송을 nginx X-Accel-Redirect로 위임 (nginx internal location 필요)
+ACCEL_REDIRECT_PREFIX = os.getenv("IMAGE_ACCEL_REDIRECT_PREFIX") or ""
+
+# 디코드된 RGBA 픽셀을 원본 옆에 비압축 .npy(메모리 맵)로 저장해 재디코드 생략 (로컬 스토리지 전용, 픽셀당 4바이트 디스크 사용)
+PIXEL_SIDECAR_ENABLED = (os.getenv("PIXEL_SIDECAR_ENABLED") or "false").lower() == "true"
+PIXEL_SIDECAR_TARGETS = {t.strip() for t in (os.getenv("PIXEL_SIDECAR_TARGETS") or "upload").split(",") if t.strip()}
+# 사이드카 전체 용량 상한. 넘으면 가장 오래 사용하지 않은 것부터 삭제 (LRU)
+PIXEL_SIDECAR_MAX_BYTES = int(os.getenv("PIXEL_SIDECAR_MAX_MB") or "2048") * 1024 * 1024
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+# Pillow 디코드/인코딩, S3 업로드 등 블로킹 작업 전용 풀 (이벤트 루프를 막지 않도록)
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS") or "4")
+
+@lru_cache(maxsize=1)
+def get_blocking_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="image-worker")
+
+async def run_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """동시 실행 수가 IMAGE_WORKERS로 제한된 스레드 풀에서 fn 실행."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_blocking_executor(), partial(fn, *args, **kwargs))
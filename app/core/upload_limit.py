@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Awaitable, Callable, Dict, Iterable
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+class BodyTooLarge(Exception):
+    pass
+
+class UploadSizeLimitMiddleware:
+    """
+    지정된 경로의 요청 본문 크기를 max_bytes로 제한하는 ASGI 미들웨어.
+    - Content-Length가 상한을 넘으면 본문을 읽기 전에 바로 413
+    - 길이를 모르는(chunked) 요청은 수신하면서 누적 바이트를 세다가 넘는 순간 중단 후 413
+    multipart 파싱(임시파일 스풀)보다 앞단에서 동작하므로 큰 업로드가 디스크/메모리에 쌓이지 않음.
+    """
+    def __init__(self, app: ASGIApp, max_bytes: int, paths: Iterable[str]):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.paths = {p.rstrip("/") for p in paths}
+
+    async def _reject(self, send: Send) -> None:
+        body = json.dumps({"detail": "업로드 용량 초과"}, ensure_ascii=False).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"].rstrip("/") not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length" and value.isdigit() and int(value) > self.max_bytes:
+                await self._reject(send)
+                return
+
+        received = 0
+        exceeded = False
+        rejected = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    exceeded = True
+                    raise BodyTooLarge()
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            # 본문 파싱 오류를 앱이 400 등으로 바꿔 응답하더라도 상한 초과면 413으로 대체
+            nonlocal rejected
+            if exceeded:
+                if not rejected:
+                    rejected = True
+                    await self._reject(send)
+                return
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except BodyTooLarge:
+            if not rejected:
+                await self._reject(send)
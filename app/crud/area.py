@@ -1,10 +1,13 @@
-from typing import List
-from sqlalchemy import select
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import case, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.tx import tx
 from app.models.area import Area
+from app.models.enums.service import Language
+from app.models.service import Service
 from app.schemas.area import AreaCreate, AreaRead, AreaUpdate
+from app.schemas.service import ServiceUpdate
 
 async def create_areas_bulk(db: AsyncSession, areas_in: List[AreaCreate]) -> List[AreaRead]:
   async with tx(db):
@@ -15,6 +18,8 @@ async def create_areas_bulk(db: AsyncSession, areas_in: List[AreaCreate]) -> Lis
       y2 = area.y2,
       service_id = area.service_id,
       area_image_id = area.area_image_id,
+      origin_text = area.origin_text,
+      ocr_text = area.ocr_text,
     ) for area in areas_in]
     db.add_all(db_areas)
 
@@ -36,12 +41,69 @@ async def update_area(db: AsyncSession, area_in: AreaUpdate) -> AreaRead:
   
   return AreaRead.model_validate(area)
 
+async def update_areas_bulk(db: AsyncSession, service_id: int, areas_in: List[AreaUpdate], service_in: ServiceUpdate | None = None) -> None:
+  """
+  서비스의 여러 영역 텍스트를 UPDATE 한 문장(CASE id WHEN ...)으로 갱신하고,
+  service_in이 있으면 서비스 step/status 전환까지 같은 트랜잭션에서 커밋.
+  """
+  origin_texts = {a.id: a.origin_text for a in areas_in if a.origin_text is not None}
+  ocr_texts = {a.id: a.ocr_text for a in areas_in if a.ocr_text is not None}
+  translated_texts = {a.id: a.translated_text for a in areas_in if a.translated_text is not None}
+
+  values: Dict[str, Any] = {}
+  if origin_texts:
+    values["origin_text"] = case(origin_texts, value=Area.id, else_=Area.origin_text)
+  if ocr_texts:
+    values["ocr_text"] = case(ocr_texts, value=Area.id, else_=Area.ocr_text)
+  if translated_texts:
+    values["translated_text"] = case(translated_texts, value=Area.id, else_=Area.translated_text)
+
+  async with tx(db):
+    if values:
+      ids = set(origin_texts) | set(ocr_texts) | set(translated_texts)
+      await db.execute(
+        update(Area)
+        .where(Area.service_id == service_id, Area.id.in_(ids))
+        .values(values)
+        .execution_options(synchronize_session=False)
+      )
+
+    if service_in:
+      await db.execute(
+        update(Service)
+        .where(Service.id == service_id)
+        .values(service_in.model_dump(exclude_unset=True))
+        .execution_options(synchronize_session=False)
+      )
+
 async def read_areas_bulk_by_service_id(db: AsyncSession, service_id: int) -> List[AreaRead]:
   async with tx(db, nested=False):
     result = await db.execute(select(Area).where(Area.service_id == service_id))
     areas = result.scalars().all()
   return [AreaRead.model_validate(area) for area in areas]
 
+async def read_reusable_ocr_texts(
+  db: AsyncSession, origin_image_id: int, origin_language: Language, exclude_service_id: int
+) -> Dict[Tuple[int, int, int, int], str]:
+  """
+  같은 원본 이미지 + 같은 원본 언어의 이전 서비스에서 OCR이 끝난 영역 텍스트를 (x1, y1, x2, y2)별로 반환.
+  원본 이미지는 사용자 간에 공유(중복 제거)되므로 사용자가 수정한 origin_text가 아닌 OCR 원본(ocr_text)만 사용.
+  """
+  async with tx(db, nested=False):
+    result = await db.execute(
+      select(Area.x1, Area.y1, Area.x2, Area.y2, Area.ocr_text)
+      .join(Service, Service.id == Area.service_id)
+      .where(
+        Service.origin_image_id == origin_image_id,
+        Service.origin_language == origin_language,
+        Service.id != exclude_service_id,
+        Area.ocr_text.is_not(None),
+      )
+      .order_by(Area.id)
+    )
+    rows = result.all()
+  return {(x1, y1, x2, y2): ocr_text for x1, y1, x2, y2, ocr_text in rows}
+
 async def read_area_by_id(db: AsyncSession, area_id: int) -> AreaRead | None:
   async with tx(db):
     result = await db.execute(select(Area).where(Area.id == area_id))
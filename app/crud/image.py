@@ -9,6 +9,8 @@ async def create_image(db: AsyncSession, image_in: ImageCreate) -> ImageRead:
   async with tx(db):
     db_image = Image(
       filename = image_in.filename,
+      content_hash = image_in.content_hash,
+      perceptual_hash = image_in.perceptual_hash,
     )
     db.add(db_image)
     await db.flush()
@@ -26,4 +28,16 @@ async def read_image_by_filename(db: AsyncSession, filename: str) -> ImageRead |
   async with tx(db, nested=False):
     result = await db.execute(select(Image).where(Image.filename == filename))
     image = result.scalars().first()
-  return ImageRead.model_validate(image) if image else None
\ No newline at end of file
+  return ImageRead.model_validate(image) if image else None
+
+async def read_image_by_content_hash(db: AsyncSession, content_hash: str) -> ImageRead | None:
+  async with tx(db, nested=False):
+    result = await db.execute(select(Image).where(Image.content_hash == content_hash).order_by(Image.id).limit(1))
+    image = result.scalars().first()
+  return ImageRead.model_validate(image) if image else None
+
+async def read_image_by_perceptual_hash(db: AsyncSession, perceptual_hash: str) -> ImageRead | None:
+  async with tx(db, nested=False):
+    result = await db.execute(select(Image).where(Image.perceptual_hash == perceptual_hash).order_by(Image.id).limit(1))
+    image = result.scalars().first()
+  return ImageRead.model_validate(image) if image else None
@@ -1,15 +1,29 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+import redis
 from app.api.v1.routers import api_router
 
 from app.constants.client_url import CLIENT_URL
+from app.constants.image_path import UPLOAD_MAX_BYTES
+from app.core.upload_limit import UploadSizeLimitMiddleware
 from app.load_env import load_environment
+from app.utils.gpu_slots import build_gpu_scheduler
+from app.utils.ocr_cache import ocr_cache_stats
+from app.utils.translation_memory import translation_cache_stats
 
 load_environment()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # GPU 슬롯 설정(GPU_SLOTS/GPU_HOST)이 없는 환경(API 단독 실행 등)에서는 /health/gpu만 비활성화
+    try:
+        app.state.gpu_scheduler = build_gpu_scheduler()
+    except ValueError as e:
+        print(f"⚠️ GPU slot scheduler disabled: {e}")
+        app.state.gpu_scheduler = None
+
     yield  # 여기서 FastAPI 앱이 실행됨
 
     # 앱 종료 시 (필요하면 여기 추가)
@@ -26,6 +40,10 @@ origins = [
     CLIENT_URL
 ]
 
+# 업로드 본문을 multipart 파싱 전에 스트리밍 단계에서 제한
+# (나중에 추가한 미들웨어가 바깥쪽이므로 CORS보다 먼저 등록해야 413 응답에도 CORS 헤더가 붙음)
+app.add_middleware(UploadSizeLimitMiddleware, max_bytes=UPLOAD_MAX_BYTES, paths=["/api/v1/image"])
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -42,4 +60,20 @@ def read_root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+@app.get("/health/gpu")
+def gpu_health_check():
+    # GPU_SLOTS에 설정된 슬롯별 임대 현황 (GPU 추가 시 env만 바꾸면 여기 반영됨)
+    scheduler = getattr(app.state, "gpu_scheduler", None)
+    if scheduler is None:
+        return JSONResponse(status_code=503, content={"status": "disabled", "slots": []})
+    try:
+        return {"slots": scheduler.utilization()}
+    except redis.RedisError:
+        return JSONResponse(status_code=503, content={"status": "unavailable", "slots": []})
+
+@app.get("/health/cache")
+def cache_health_check():
+    # OCR 결과 캐시 / 번역 메모리의 hit/miss 및 항목 수
+    return {"ocr": ocr_cache_stats(), "tm": translation_cache_stats()}
@@ -17,8 +17,9 @@ class Area(Base):
   x2: Mapped[int] = mapped_column(Integer, nullable=False)
   y1: Mapped[int] = mapped_column(Integer, nullable=False)
   y2: Mapped[int] = mapped_column(Integer, nullable=False)
-  area_image_id: Mapped[int] = mapped_column(ForeignKey("images.id"), nullable=False)
+  area_image_id: Mapped[int] = mapped_column(ForeignKey("images.id"), nullable=True)
   origin_text: Mapped[str] = mapped_column(String, nullable=True)
+  ocr_text: Mapped[str] = mapped_column(String, nullable=True)  # 사용자 수정 전 OCR 원본 결과 (다른 서비스 재사용은 이 값만)
   translated_text: Mapped[str] = mapped_column(String, nullable=True)
   service_id: Mapped[int] = mapped_column(ForeignKey("services.id"), nullable=False)
   created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -9,5 +9,7 @@ class Image(Base):
   __tablename__ = "images"
 
   id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, autoincrement=True)
-  filename: Mapped[str] = mapped_column(String, nullable=False)
+  filename: Mapped[str] = mapped_column(String, nullable=False, index=True)
+  content_hash: Mapped[str] = mapped_column(String(64), nullable=True, index=True)
+  perceptual_hash: Mapped[str] = mapped_column(String(16), nullable=True, index=True)
   created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
@@ -10,7 +10,9 @@ class AreaBase(CommonModel):
 
 class AreaCreate(AreaBase):
   service_id: int
-  area_image_id: int
+  area_image_id: int | None = None
+  origin_text: str | None = None
+  ocr_text: str | None = None
 
 class AreaRead(AreaBase):
   id: int
@@ -32,6 +34,7 @@ class AreaReadAfterTranslating(AreaReadAfterDetecting):
 class AreaUpdate(CommonModel):
   id: int
   origin_text: str | None = None
+  ocr_text: str | None = None
   translated_text: str | None = None
 
 
@@ -5,7 +5,8 @@ class ImageBase(CommonModel):
   filename: str
 
 class ImageCreate(ImageBase):
-  pass
+  content_hash: str | None = None
+  perceptual_hash: str | None = None
 
 class ImageRead(ImageBase):
   id: int
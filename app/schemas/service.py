@@ -47,12 +47,16 @@ class GetServiceDetectingStatusResponse(ServiceBase):
   id: int
   status: ServiceStatus
   areas: List[AreaReadAfterDetecting] | None
+  done: int = 0
+  total: int = 0
 
 class GetServiceTranslatingStatusResponse(ServiceBase):
   isCompleted: bool
   id: int
   status: ServiceStatus
   areas: List[AreaReadAfterTranslating] | None
+  done: int = 0
+  total: int = 0
 
 class GetServiceComposingStatusResponse(ServiceBase):
   isCompleted: bool
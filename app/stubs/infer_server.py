@@ -0,0 +1,68 @@
+"""
+GPU 추론 서버(TextCtrl)를 대신하는 로컬 stand-in 서버 (테스트/로컬 개발용).
+실제 모델 대신 기계 번역 모드처럼 영역을 지우고 번역문을 그려서 돌려줌.
+
+  uvicorn app.stubs.infer_server:app --port 9000
+  GPU_COMPOSE_BACKEND=http GPU_FASTAPI_URL=http://localhost:9000 GPU_FASTAPI_TUNNEL=false
+"""
+import json
+import os
+import secrets
+from io import BytesIO
+from typing import Any, Dict, List
+
+from fastapi import FastAPI, File, Form, Request, UploadFile
+from fastapi.responses import Response
+from PIL import Image as PILImage, ImageDraw, ImageFont
+
+from app.constants.font_path import MACHINE_FONT_PATH
+from app.utils.text_layout import layout_text
+
+app = FastAPI(title="Tmoji Inference Stub Server")
+
+def _render(img: PILImage.Image, areas: List[Dict[str, Any]]) -> PILImage.Image:
+    draw = ImageDraw.Draw(img)
+    for area in areas:
+        x1, y1, x2, y2 = area["bbox"]
+        draw.rectangle([(x1, y1), (x2, y2)], fill="white")
+        text = area.get("target_text") or ""
+        if os.path.exists(MACHINE_FONT_PATH):
+            layout = layout_text(text, x2 - x1 - 10, y2 - y1 - 10, MACHINE_FONT_PATH)
+            draw.multiline_text((x1 + 5, y1 + 5), layout.text, fill="black", font=layout.font, spacing=layout.spacing)
+        else:
+            draw.text((x1 + 5, y1 + 5), text, fill="black", font=ImageFont.load_default())
+    return img
+
+def _png_response(img: PILImage.Image) -> Response:
+    buf = BytesIO()
+    img.save(buf, format="PNG")
+    return Response(content=buf.getvalue(), media_type="image/png")
+
+@app.post("/infer")
+async def infer(job: str = Form(...), image: UploadFile = File(...)):
+    meta = json.loads(job)
+    img = PILImage.open(BytesIO(await image.read())).convert("RGBA")
+    return _png_response(_render(img, meta.get("areas", [])))
+
+@app.post("/infer/batch")
+async def infer_batch(request: Request):
+    form = await request.form()
+    jobs = json.loads(str(form["jobs"]))
+    boundary = f"tmojistub{secrets.token_hex(12)}"
+
+    parts: List[bytes] = []
+    for i, meta in enumerate(jobs):
+        upload: Any = form[f"image_{i}"]
+        img = PILImage.open(BytesIO(await upload.read())).convert("RGBA")
+        buf = BytesIO()
+        _render(img, meta.get("areas", [])).save(buf, format="PNG")
+        parts.append(
+            f'--{boundary}\r\nContent-Type: image/png\r\nContent-Disposition: attachment; name="{meta["job_id"]}"\r\n\r\n'.encode("utf-8")
+            + buf.getvalue() + b"\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n".encode("utf-8"))
+    return Response(content=b"".join(parts), media_type=f"multipart/mixed; boundary={boundary}")
+
+@app.get("/health")
+def health_check():
+    return {"status": "healthy"}
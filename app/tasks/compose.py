@@ -1,21 +1,28 @@
 # pyright: reportUnknownMemberType=false, reportAttributeAccessIssue=false, reportUnknownVariableType=false
 
 import asyncio
+import threading
 from app.celery_app import celery
-from typing import TypedDict
+from typing import Dict, List, Optional, Tuple, TypedDict
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.constants.database_url import DATABASE_URL
+from app.constants.font_path import MACHINE_FONT_PATH
+from app.constants.image_path import DERIVATIVES_ENABLED
 from app.crud.area import read_areas_bulk_by_service_id
 from app.crud.image import create_image, read_image_by_id
 from app.crud.service import read_service_by_id, update_service
 from app.models.enums.service import ServiceMode, ServiceStatus, ServiceStep
 from app.schemas.image import ImageCreate
 from app.schemas.service import ServiceRead, ServiceUpdate
+from app.tasks.derivatives import make_derivatives
 
-from PIL import ImageDraw, ImageFont
+from PIL import ImageDraw
 
+from app.utils.redis_client import get_redis
+from app.utils.service_events import mark_service_failed, publish_service_event
 from app.utils.storage import build_storage
+from app.utils.text_layout import layout_text
 ##### --- for ssh connect --- #####
 import os
 import time
@@ -23,12 +30,17 @@ import json
 import shlex
 import tempfile
 from dataclasses import dataclass
+from pathlib import Path
 import secrets  # NEW
+from urllib.parse import urlsplit, urlunsplit
 
 import paramiko
 from PIL import Image
 
+from app.utils.gpu_slots import build_gpu_scheduler
+from app.utils.inference import ComposeBackend, ComposeJob, HTTPInferenceBackend, paste_regions, split_into_regions
 from app.utils.ssh_keys import ensure_ed25519_key
+from app.utils.ssh_pool import SSHConnectionPool
 ###################################
 
 ##### --- SSH/FastAPI 설정 --- #####
@@ -51,11 +63,11 @@ class SSHConfig:
 
 CFG = SSHConfig()
 
-def _open_ssh_client(cfg: SSHConfig) -> paramiko.SSHClient:
+def _open_ssh_client(cfg: SSHConfig, host: Optional[str] = None) -> paramiko.SSHClient:
     client = paramiko.SSHClient()
     client.set_missing_host_key_policy(paramiko.AutoAddPolicy())  # 내부망/테스트용
     client.connect(
-        hostname=cfg.host,
+        hostname=host or cfg.host,
         port=cfg.port,
         username=cfg.user,
         key_filename=os.path.expanduser(cfg.key_path),
@@ -65,16 +77,20 @@ def _open_ssh_client(cfg: SSHConfig) -> paramiko.SSHClient:
     )
     return client
 
-def _sftp_mkdir_p(sftp: paramiko.SFTPClient, path: str) -> None:
-    # SFTP에는 -p가 없어서 재귀 생성
-    parts = [p for p in path.split("/") if p]
-    cur = "/"
-    for p in parts:
-        cur = os.path.join(cur, p)
-        try:
-            sftp.stat(cur)
-        except IOError:
-            sftp.mkdir(cur)
+# 워커 프로세스당 GPU 서버(호스트)별 연결 1개를 유지하며 작업마다 재사용
+_SSH_POOLS: Dict[str, SSHConnectionPool] = {}
+
+def _ssh_pool(host: str) -> SSHConnectionPool:
+    if host not in _SSH_POOLS:
+        _SSH_POOLS[host] = SSHConnectionPool(
+            lambda: _open_ssh_client(CFG, host),
+            keepalive_seconds=int(os.getenv("GPU_SSH_KEEPALIVE") or "30"),
+        )
+    return _SSH_POOLS[host]
+
+# GPU_SLOTS의 (host, device) 슬롯 중 가장 덜 붐비는 곳으로 작업 배정
+_gpu_scheduler = build_gpu_scheduler()
+_GPU_SLOT_WAIT_TIMEOUT = int(os.getenv("GPU_SLOT_WAIT_TIMEOUT") or "3600")
 
 ###################################
 
@@ -84,31 +100,6 @@ SessionLocal = async_sessionmaker(_engine, expire_on_commit=False, class_=AsyncS
 
 storage = build_storage()
 
-def get_resized_font(
-  text: str,
-  max_width: int,
-  max_height: int,
-  font_path: str,
-  min_font_size: int = 5,
-  max_font_size: int = 100
-) -> ImageFont.FreeTypeFont:
-  """
-  텍스트가 max_width와 max_height 안에 최대한 꽉 차도록 폰트 크기를 조절.
-  """
-  best_font = ImageFont.truetype(font_path, min_font_size)
-  for font_size in range(min_font_size, max_font_size + 1):
-      font = ImageFont.truetype(font_path, font_size)
-      bbox = font.getbbox(text)
-      text_width = bbox[2] - bbox[0]
-      text_height = bbox[3] - bbox[1]
-
-      if text_width > max_width or text_height > max_height:
-          # 넘었으면 이전 크기로 반환
-          return best_font
-      best_font = font
-
-  return best_font
-
 async def compose_image_machine_mode(db: AsyncSession, service: ServiceRead) -> None:
   origin_image_read = await read_image_by_id(db, service.origin_image_id)
 
@@ -126,59 +117,159 @@ async def compose_image_machine_mode(db: AsyncSession, service: ServiceRead) ->
 
     box_width = area.x2 - area.x1
     box_height = area.y2 - area.y1
-    font = get_resized_font(text, box_width - 10, box_height - 10, './font/PretendardJP-Regular.ttf')
+    layout = layout_text(text, box_width - 10, box_height - 10, MACHINE_FONT_PATH)
 
     text_position = (area.x1 + 5, area.y1 + 5)
-    draw.text(text_position, text, fill="black", font=font)
+    draw.multiline_text(text_position, layout.text, fill="black", font=layout.font, spacing=layout.spacing)
   
-  composed_filename = f"composed_{origin_image_read.filename}"
-  storage.save_png(imageFile, composed_filename, target="compose")
+  composed_filename = storage.save_image(imageFile, f"composed_{service.id}_{Path(origin_image_read.filename).stem}", target="compose")
 
   created_image = await create_image(db, image_in=ImageCreate(filename=composed_filename))
   service_in = ServiceUpdate(composed_image_id=created_image.id)
   await update_service(db, service.id, service_in=service_in)
+  if DERIVATIVES_ENABLED:
+    make_derivatives.delay(composed_filename, "compose")
 
 
 ##### --------- SSH --------- #####
-async def compose_image_ai_mode(db: AsyncSession, service: ServiceRead) -> None:
+class SSHScriptBackend:
     """
+    작업마다 GPU 서버에 입력을 올리고 infer.sh를 실행하는 기존 방식.
     1) 원본 이미지를 임시파일로 저장
     2) Paramiko로 GPU 서버에 업로드
-    3) SSH exec_command로 FastAPI /infer 호출(curl)
+    3) SSH exec_command로 infer.sh 실행
     4) 결과물 다운로드
-    5) compose 스토리지에 저장 + DB 업데이트
     """
+    def __init__(self, pool: SSHConnectionPool):
+        self.pool = pool
+
+    def compose(self, job: ComposeJob) -> Image.Image:
+        job_id = job.job_id
+        # 1) 원본 이미지를 임시 파일로 저장
+        local_in = os.path.join(tempfile.gettempdir(), f"{job_id}_in.png")
+        job.image.save(local_in, format="PNG")
+
+        # 2-1) 원격 작업 전용 경로 세팅(지금 gpu서버엔 ssh_input, ssh_output으로 되어있음)
+        remote_job_dir = f"{CFG.remote_in_dir}/{job_id}"
+        remote_in = f"{remote_job_dir}/input.png"
+        remote_job_json = f"{remote_job_dir}/job.json"
+        remote_out_root = CFG.remote_out_dir  # 결과 루트 (스크립트가 out_root/<job_id>/... 생성)
+        remote_script = "/home/undergrad/model_base/TextCtrl-Translate/infer.sh"
+
+        # 2-2) 데이터 종합한 meta만들고, 보낼 준비 끗
+        job_meta = {
+            **job.meta(),
+            "input_path": remote_in,
+            "out_root": remote_out_root,
+            "naming": {"digits": 5, "start": 0},
+        }
+        job_meta_str = json.dumps(job_meta, ensure_ascii=False)
+
+        # 3) ssh통신
+        # Paramiko는 블로킹[동기]이지만, 여긴 샐러리 태스크 안이라 메인(fastAPI) 프로세스와 분리되어 있으므로 동기 그대로 실행
+        with self.pool.session() as (client, sftp):
+            self.pool.mkdir_p(remote_job_dir)
+            self.pool.mkdir_p(CFG.remote_out_dir)
+            sftp.put(local_in, remote_in)
+            with sftp.open(remote_job_json, "w", bufsize=32768) as f:
+                f.write(job_meta_str)
+
+            base_cmd = f"{shlex.quote(remote_script)} --job {shlex.quote(remote_job_json)}"
+            gpu_sel  = f"CUDA_DEVICE_ORDER=PCI_BUS_ID CUDA_VISIBLE_DEVICES={shlex.quote(job.device or '7')}"  # <- 스케줄러가 배정한 GPU
+            full_cmd = f"{gpu_sel} {base_cmd}"
+            cmd = f"bash -lc {shlex.quote(full_cmd)}"
+
+            stdin, stdout, stderr = client.exec_command(cmd, timeout=3600, get_pty=True)
+            out_txt = stdout.read().decode("utf-8", "ignore")
+            err_txt = stderr.read().decode("utf-8", "ignore")
+            rc = stdout.channel.recv_exit_status()
+            if rc != 0:
+                raise RuntimeError(f"Remote failed (rc={rc})\nSTDOUT:\n{out_txt}\nSTDERR:\n{err_txt}")
+
+            # 4) 결과물 다운로드
+            remote_composed = f"{remote_out_root}/{job_id}/all_result/composed.png"
+            local_composed  = os.path.join(tempfile.gettempdir(), f"{job_id}_composed.png")
+            sftp.get(remote_composed, local_composed)
+
+        return Image.open(local_composed)
+
+    def compose_batch(self, jobs: List[ComposeJob]) -> List[Image.Image]:
+        # infer.sh는 작업 1개 단위라 순서대로 실행 (연결은 풀에서 재사용)
+        return [self.compose(job) for job in jobs]
+
+def _build_compose_backend(host: str) -> ComposeBackend:
+    """GPU_COMPOSE_BACKEND=http 이면 상주 추론 서버(GPU_FASTAPI_URL) 사용, 기본은 infer.sh 실행."""
+    backend = (os.getenv("GPU_COMPOSE_BACKEND") or "ssh").lower()
+    if backend == "http":
+        # GPU_FASTAPI_URL이 GPU 서버 기준 주소이므로 기본적으로 해당 호스트의 SSH 포워딩 채널로 접속
+        use_tunnel = (os.getenv("GPU_FASTAPI_TUNNEL") or "true").lower() == "true"
+        url = CFG.fastapi_infer_url
+        if not use_tunnel and host != CFG.host:
+            # 터널 없이 직접 접속하면 슬롯 호스트로 주소를 바꿔서 사용 (포트/경로는 동일하다고 가정)
+            parts = urlsplit(url)
+            url = urlunsplit(parts._replace(netloc=f"{host}:{parts.port or 80}"))
+        return HTTPInferenceBackend(
+            url,
+            timeout=float(os.getenv("GPU_FASTAPI_TIMEOUT") or "600"),
+            tunnel=_ssh_pool(host).open_tunnel if use_tunnel else None,
+        )
+    return SSHScriptBackend(_ssh_pool(host))
+
+_compose_backends: Dict[str, ComposeBackend] = {}
+
+# full: 원본 전체 이미지를 주고받음 / regions: 영역(+여백)만 잘라 보내고 다시 그려진 패치만 받아 로컬에서 붙여넣음
+_AI_PAYLOAD = (os.getenv("COMPOSE_AI_PAYLOAD") or "full").lower()
+_AI_REGION_MARGIN = int(os.getenv("COMPOSE_AI_REGION_MARGIN") or "32")
+
+def _compose_on_gpu(jobs: List[ComposeJob]) -> List[Image.Image]:
+    if _AI_PAYLOAD != "regions":
+        return _compose_on_slot(jobs)
+
+    # 모든 작업의 영역 패치를 한 번의 요청(compose_batch)으로 보냄
+    split = [split_into_regions(job, _AI_REGION_MARGIN) for job in jobs]
+    sub_jobs = [patch.job for patches in split for patch in patches]
+    results = _compose_on_slot(sub_jobs) if sub_jobs else []
+
+    composed: List[Image.Image] = []
+    offset = 0
+    for job, patches in zip(jobs, split):
+        composed.append(paste_regions(job.image, patches, results[offset:offset + len(patches)]))
+        offset += len(patches)
+    return composed
+
+def _compose_on_slot(jobs: List[ComposeJob]) -> List[Image.Image]:
+    """GPU 슬롯을 임대해 해당 호스트/장치에서 합성하고, 끝나면 슬롯 반납."""
+    with _gpu_scheduler.lease(timeout=_GPU_SLOT_WAIT_TIMEOUT) as slot:
+        print(f"--------GPU SLOT {slot.name}, Jobs: {[job.job_id for job in jobs]}")
+        if slot.host not in _compose_backends:
+            _compose_backends[slot.host] = _build_compose_backend(slot.host)
+        backend = _compose_backends[slot.host]
+        for job in jobs:
+            job.device = slot.device
+        if len(jobs) == 1:
+            return [backend.compose(jobs[0])]
+        return backend.compose_batch(jobs)
+
+async def _build_ai_job(db: AsyncSession, service: ServiceRead) -> Tuple[ComposeJob, str]:
+    """원본 이미지 + 영역(원문/번역문) 정보로 합성 작업 생성. (작업, 원본 파일명) 반환."""
     origin_image = await read_image_by_id(db, service.origin_image_id)
     if not origin_image:
         raise Exception("id와 일치하는 image를 찾을 수 없습니다.")
 
-    # 1-1) 원본 이미지를 임시 파일로 저장
+    # 1) 원본 이미지 로드
     pil_img = storage.load_image(origin_image.filename, "upload")
     if pil_img.mode != "RGBA":
         pil_img = pil_img.convert("RGBA")
 
-    # 1-2) 작업들 이름 충돌 방지용으로 랜덤 한스푼
+    # 2) 작업들 이름 충돌 방지용으로 랜덤 한스푼
     job_id = f"svc{service.id}_{int(time.time())}_{secrets.token_hex(4)}"
-    local_in = os.path.join(tempfile.gettempdir(), f"{job_id}_in.png")
-    pil_img.save(local_in, format="PNG")
-
-    # 2-1) 원격 작업 전용 경로 세팅(지금 gpu서버엔 ssh_input, ssh_output으로 되어있음)
-    remote_job_dir = f"{CFG.remote_in_dir}/{job_id}"
-    remote_in = f"{remote_job_dir}/input.png"
-    remote_job_json = f"{remote_job_dir}/job.json"
-    remote_out_root = CFG.remote_out_dir  # 결과 루트 (스크립트가 out_root/<job_id>/... 생성)
-    remote_script = "/home/undergrad/model_base/TextCtrl-Translate/infer.sh"
 
-    # 2-2) DB의 areas도 세팅
+    # 3) DB의 areas도 세팅
     areas = await read_areas_bulk_by_service_id(db, service.id)
-
-    # 2-3) 데이터 종합한 meta만들고, 보낼 준비 끗
-    job_meta = {
-        "job_id": job_id,
-        "input_path": remote_in,
-        "out_root": remote_out_root,
-        "naming": {"digits": 5, "start": 0},
-        "areas": [
+    job = ComposeJob(
+        job_id=job_id,
+        image=pil_img,
+        areas=[
             {
                 "bbox": [a.x1, a.y1, a.x2, a.y2],
                 # 예시 규칙: i_s.txt = source_text(원문), i_t.txt = target_text(번역)
@@ -187,55 +278,186 @@ async def compose_image_ai_mode(db: AsyncSession, service: ServiceRead) -> None:
             }
             for a in areas
         ],
-    }
-    job_meta_str = json.dumps(job_meta, ensure_ascii=False)
-
-    # 3) ssh통신 함수 
-    def _do_ssh_roundtrip() -> dict:
-      client = _open_ssh_client(CFG)
-      sftp = client.open_sftp()
-      try:
-          _sftp_mkdir_p(sftp, remote_job_dir)
-          _sftp_mkdir_p(sftp, CFG.remote_out_dir)
-          sftp.put(local_in, remote_in)
-          with sftp.open(remote_job_json, "w", bufsize=32768) as f:
-              f.write(job_meta_str)
-
-          base_cmd = f"{shlex.quote(remote_script)} --job {shlex.quote(remote_job_json)}"
-          gpu_sel  = "CUDA_DEVICE_ORDER=PCI_BUS_ID CUDA_VISIBLE_DEVICES=7"  # <- 원하는 GPU 선택, 현재는 7번으로 해놓음
-          full_cmd = f"{gpu_sel} {base_cmd}"
-          cmd = f"bash -lc {shlex.quote(full_cmd)}"
-
-          stdin, stdout, stderr = client.exec_command(cmd, timeout=3600, get_pty=True)
-          out_txt = stdout.read().decode("utf-8", "ignore")
-          err_txt = stderr.read().decode("utf-8", "ignore")
-          rc = stdout.channel.recv_exit_status()
-          if rc != 0:
-              raise RuntimeError(f"Remote failed (rc={rc})\nSTDOUT:\n{out_txt}\nSTDERR:\n{err_txt}")
-
-          # 결과물 다운로드
-          remote_composed = f"{remote_out_root}/{job_id}/all_result/composed.png"
-          local_composed  = os.path.join(tempfile.gettempdir(), f"{job_id}_composed.png")
-          sftp.get(remote_composed, local_composed)
-
-          return local_composed
-      finally:
-          try: sftp.close()
-          except: pass
-          client.close()
-
-    # Paramiko는 블로킹[동기]이므로 따로 스레드로 빼서, 현재거 안막히게 해줬으나, 어짜피 selary에 들어가 있는거라면 상관없을 것 같아서 동기 그대로 실행
-    # 동훈) 맞아유, 여긴 샐러리 태스크 안에 있기 때문에, 현재 태스크 자체가 메인(fastAPI) 프로세스랑 따로 분리되어서 실행중인 프로세스임니다
-    local_composed = _do_ssh_roundtrip()
-
-    # 4) compose 스토리지에 저장 + DB 업데이트
-    result_img = Image.open(local_composed)
-    composed_filename = f"composed_{origin_image.filename}"
-    storage.save_png(result_img, composed_filename, target="compose")
+    )
+    return job, origin_image.filename
+
+async def _save_composed(db: AsyncSession, service_id: int, origin_filename: str, img: Image.Image) -> None:
+    """compose 스토리지에 저장 + 서비스의 composed_image_id 갱신."""
+    # 같은 원본 이미지를 여러 서비스가 공유할 수 있으므로 서비스 id를 포함
+    composed_filename = storage.save_image(img, f"composed_{service_id}_{Path(origin_filename).stem}", target="compose")
 
     created_image = await create_image(db, image_in=ImageCreate(filename=composed_filename))
     service_in = ServiceUpdate(composed_image_id=created_image.id)
-    await update_service(db, service.id, service_in=service_in)
+    await update_service(db, service_id, service_in=service_in)
+    if DERIVATIVES_ENABLED:
+        make_derivatives.delay(composed_filename, "compose")
+
+async def compose_image_ai_mode(db: AsyncSession, service: ServiceRead) -> None:
+    """
+    1) 원본 이미지 + 영역 정보로 작업 생성
+    2) compose 백엔드(infer.sh over SSH 또는 상주 추론 서버)로 합성
+    3) compose 스토리지에 저장 + DB 업데이트
+    """
+    job, origin_filename = await _build_ai_job(db, service)
+    result_img = _compose_on_gpu([job])[0]
+    await _save_composed(db, service.id, origin_filename, result_img)
+
+##### --- 서비스 간 GPU 작업 배치 --- #####
+# 윈도우(ms) 동안 들어온 AI 합성 작업을 최대 _BATCH_MAX개까지 모아 한 번에 GPU로 보냄. 0이면 비활성화
+_BATCH_WINDOW = int(os.getenv("COMPOSE_AI_BATCH_WINDOW_MS") or "0") / 1000
+_BATCH_MAX = max(1, int(os.getenv("COMPOSE_AI_BATCH_MAX") or "4"))
+# 리더 락 TTL. 리더는 처리 중 TTL/3마다 연장하므로, 리더가 죽으면 이 시간 안에 다른 워커가 이어받음
+_BATCH_LOCK_TTL = max(3, int(os.getenv("COMPOSE_AI_BATCH_LOCK_TTL") or "30"))
+_BATCH_QUEUE = "compose:ai:pending"
+_BATCH_INFLIGHT = "compose:ai:inflight"  # 리더가 꺼내 처리 중인 서비스 (리더가 죽으면 다음 리더가 대기열로 되돌림)
+_BATCH_LOCK = "compose:ai:leader"
+
+# 대기열 앞에서 최대 N개를 꺼내 inflight로 옮김 (원자적)
+_CLAIM_SCRIPT = """
+local ids = redis.call('LRANGE', KEYS[1], 0, tonumber(ARGV[1]) - 1)
+if #ids > 0 then
+  redis.call('LTRIM', KEYS[1], #ids, -1)
+  redis.call('RPUSH', KEYS[2], unpack(ids))
+end
+return ids
+"""
+# 락을 가진 토큰일 때만 연장/해제
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+class _BatchLeader:
+    """짧은 TTL의 리더 락을 잡고, 보유하는 동안 백그라운드 스레드에서 계속 연장 (GPU 호출이 길어도 락 유지)."""
+    def __init__(self) -> None:
+        self.r = get_redis()
+        self.token = secrets.token_hex(8)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def acquire(self) -> bool:
+        if not self.r.set(_BATCH_LOCK, self.token, nx=True, ex=_BATCH_LOCK_TTL):
+            return False
+        self._thread = threading.Thread(target=self._renew_loop, daemon=True)
+        self._thread.start()
+        return True
+
+    def _renew_loop(self) -> None:
+        while not self._stop.wait(_BATCH_LOCK_TTL / 3):
+            try:
+                if not self.r.eval(_RENEW_SCRIPT, 1, _BATCH_LOCK, self.token, _BATCH_LOCK_TTL):
+                    print("[WARN] AI compose batch leader lock lost")
+                    return
+            except Exception as e:
+                print(f"[WARN] AI compose batch leader lock renew failed: {e}")
+
+    def release(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self.r.eval(_RELEASE_SCRIPT, 1, _BATCH_LOCK, self.token)
+
+async def _finish_service(db: AsyncSession, service_id: int) -> None:
+    service_in = ServiceUpdate(step=ServiceStep.COMPOSING, status=ServiceStatus.COMPLETED)
+    await update_service(db, service_id, service_in)
+    publish_service_event(service_id, ServiceStep.COMPOSING, ServiceStatus.COMPLETED)
+
+async def _run_ai_batch(db: AsyncSession, service_ids: List[int]) -> None:
+    """
+    모은 서비스들을 하나의 multi-job 요청으로 합성하고, 결과를 각 서비스에 나눠 저장.
+    실패는 서비스별로 처리: 준비/저장에 실패한 서비스만 FAILED, 배치 요청 자체가 실패하면 작업별로 다시 시도해 원인 작업만 FAILED.
+    """
+    prepared: List[Tuple[int, ComposeJob, str]] = []
+    for service_id in service_ids:
+        try:
+            service = await read_service_by_id(db, service_id)
+            if not service:
+                raise Exception("id와 일치하는 service를 찾을 수 없습니다.")
+            job, origin_filename = await _build_ai_job(db, service)
+            prepared.append((service_id, job, origin_filename))
+        except Exception as e:
+            print(f"[ERROR] AI compose job build failed (service_id={service_id}): {e}")
+            await mark_service_failed(db, service_id, ServiceStep.COMPOSING)
+
+    if not prepared:
+        return
+    print(f"--------AI COMPOSE BATCH, Services: {[p[0] for p in prepared]}")
+    results: List[Optional[Image.Image]]
+    try:
+        results = list(_compose_on_gpu([job for _, job, _ in prepared]))
+    except Exception as e:
+        if len(prepared) == 1:
+            results = [None]
+        else:
+            print(f"[WARN] AI compose batch failed, retrying jobs one by one: {e}")
+            results = []
+            for service_id, job, _ in prepared:
+                try:
+                    results.append(_compose_on_gpu([job])[0])
+                except Exception as job_error:
+                    print(f"[ERROR] AI compose failed (service_id={service_id}): {job_error}")
+                    results.append(None)
+
+    for (service_id, _, origin_filename), img in zip(prepared, results):
+        if img is None:
+            await mark_service_failed(db, service_id, ServiceStep.COMPOSING)
+            continue
+        try:
+            await _save_composed(db, service_id, origin_filename, img)
+            await _finish_service(db, service_id)
+        except Exception as e:
+            print(f"[ERROR] AI compose save failed (service_id={service_id}): {e}")
+            await mark_service_failed(db, service_id, ServiceStep.COMPOSING)
+
+def enqueue_ai_batch(service_id: int) -> None:
+    """
+    서비스를 배치 대기열에 넣고 drain 태스크를 예약한 뒤 바로 반환 (워커 슬롯을 점유한 채 기다리지 않음).
+    윈도우가 끝나거나 대기열이 최대 배치 크기에 도달하면 drain이 실행됨.
+    """
+    queued = get_redis().rpush(_BATCH_QUEUE, service_id)
+    if queued >= _BATCH_MAX:
+        drain_ai_batch.delay()
+    else:
+        drain_ai_batch.apply_async(countdown=_BATCH_WINDOW)
+
+@celery.task(acks_late=True, reject_on_worker_lost=True)
+def drain_ai_batch() -> bool:
+    """
+    리더 락을 잡은 drain만 대기열을 처리하고, 나머지는 바로 종료.
+    이전 리더가 처리하던(inflight) 서비스는 다시 대기열 앞으로 되돌린 뒤 처리.
+    """
+    leader = _BatchLeader()
+    if not leader.acquire():
+        return False
+    r = leader.r
+    try:
+        while r.lmove(_BATCH_INFLIGHT, _BATCH_QUEUE, "RIGHT", "LEFT"):
+            pass
+
+        async def _run() -> None:
+            async with SessionLocal() as db:
+                while True:
+                    service_ids = [int(i) for i in r.eval(_CLAIM_SCRIPT, 2, _BATCH_QUEUE, _BATCH_INFLIGHT, _BATCH_MAX)]
+                    if not service_ids:
+                        return
+                    await _run_ai_batch(db, service_ids)
+                    r.delete(_BATCH_INFLIGHT)
+
+        asyncio.run(_run())
+    finally:
+        leader.release()
+        # 락 해제 직전에 들어와 그냥 종료된 drain이 있을 수 있으므로 남은 작업이 있으면 다시 예약
+        if r.llen(_BATCH_QUEUE):
+            drain_ai_batch.delay()
+    return True
 ###################################
 
 class ComposePayload(TypedDict):
@@ -246,17 +468,24 @@ def compose_image(payload: ComposePayload) -> bool:
     """Celery 워커에서 실행되는 동기 엔트리. 내부에서 async 실행."""
     async def _run() -> bool:
       async with SessionLocal() as db:
-        service = await read_service_by_id(db, payload["service_id"])
-        if not service:
-          raise Exception("id와 일치하는 service를 찾을 수 없습니다.")
+        try:
+          service = await read_service_by_id(db, payload["service_id"])
+          if not service:
+            raise Exception("id와 일치하는 service를 찾을 수 없습니다.")
         
-        if service.mode == ServiceMode.AI:
-          await compose_image_ai_mode(db, service)
-        else:
-          await compose_image_machine_mode(db, service)
+          if service.mode == ServiceMode.AI and _BATCH_WINDOW > 0:
+            # 완료/실패 기록은 배치를 처리한 drain_ai_batch가 서비스별로 함
+            enqueue_ai_batch(service.id)
+            return True
+          elif service.mode == ServiceMode.AI:
+            await compose_image_ai_mode(db, service)
+          else:
+            await compose_image_machine_mode(db, service)
           
-        service_in = ServiceUpdate(step=ServiceStep.COMPOSING, status=ServiceStatus.COMPLETED)
-        await update_service(db, service.id, service_in)
+          await _finish_service(db, service.id)
+        except Exception:
+          await mark_service_failed(db, payload["service_id"], ServiceStep.COMPOSING)
+          raise
 
       return True
 
@@ -0,0 +1,35 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+from app.celery_app import celery
+from app.constants.database_url import DATABASE_URL
+from app.crud.image import create_image, read_image_by_filename
+from app.schemas.image import ImageCreate
+from app.utils.derivatives import render_derivatives
+from app.utils.storage import Target, build_storage
+
+# --- 워커 전용 세션팩토리 ---
+_engine = create_async_engine(DATABASE_URL, future=True)
+SessionLocal = async_sessionmaker(_engine, expire_on_commit=False, class_=AsyncSession)
+
+storage = build_storage()
+
+@celery.task
+def make_derivatives(filename: str, target: Target = "upload") -> int:
+    """업로드/합성된 이미지의 썸네일/웹용 파생 이미지를 생성해 derived 스토리지에 저장."""
+    print(f"--------DERIVATIVES TASK, Image: {filename}")
+    img = storage.load_image(filename, target)
+    outputs = render_derivatives(img, filename)
+    for derived_filename, data in outputs.items():
+        storage.save_bytes(data, derived_filename, target="derived")
+
+    # 저장이 끝난 뒤 images에 등록 -> 이미지 API는 이 행으로 존재 여부를 판단
+    async def _register() -> None:
+        async with SessionLocal() as db:
+            for derived_filename in outputs:
+                if not await read_image_by_filename(db, derived_filename):
+                    await create_image(db, image_in=ImageCreate(filename=derived_filename))
+
+    asyncio.run(_register())
+    return len(outputs)
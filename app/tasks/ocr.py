@@ -1,23 +1,28 @@
 # pyright: reportUnknownMemberType=false, reportAttributeAccessIssue=false, reportUnknownVariableType=false
 
 import asyncio
+from collections import defaultdict
 from enum import Enum
 from functools import lru_cache
+import gc
 import os
-from typing import List, TypedDict
-import uuid
+from typing import Any, Dict, Iterator, List, NotRequired, TypedDict
 
+import numpy as np
+from PIL import Image as PILImage
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from paddleocr import PaddleOCR # type: ignore
+from paddlex.inference import load_pipeline_config # type: ignore
+from celery.signals import worker_init, worker_process_init, worker_shutdown
 
 from app.constants.database_url import DATABASE_URL
-from app.constants.image_path import IMAGE_BASE_DIR
-from app.crud.area import update_area
-from app.crud.service import update_service
+from app.crud.area import update_areas_bulk
 from app.models.enums.service import ServiceStatus, ServiceStep
 from app.schemas.area import AreaUpdate
 from app.schemas.service import ServiceUpdate # pyright: ignore[reportMissingTypeStubs]
 from app.celery_app import celery
+from app.utils.ocr_cache import build_ocr_cache, ocr_cache_key
+from app.utils.service_events import mark_service_failed, publish_service_event
 from app.utils.storage import build_storage
 
 # --- 워커 전용 세션팩토리 ---
@@ -26,66 +31,193 @@ SessionLocal = async_sessionmaker(_engine, expire_on_commit=False, class_=AsyncS
 
 storage = build_storage()
 
+# 같은 픽셀 + 같은 언어의 crop은 추론 없이 이전 결과 사용 (재시도, 중복 서비스, 같은 영역 재지정)
+_ocr_cache = build_ocr_cache()
+
 # --- OCR 초기화 (언어 매핑 필요시 변환) ---
 _LANG_MAP = {"EN": "en", "KO": "korean", "JP": "japan"}
 _DEFAULT = "en"
 
+# 한 번의 PaddleOCR 호출에 넘길 crop 개수 (CPU 워커 기준 8~16 권장)
+_BATCH_SIZE = max(1, int(os.getenv("OCR_BATCH_SIZE") or "8"))
+
+# 워커 부모 프로세스에서 fork 전에 미리 로드할 언어 ("EN,KO,JP"), 비어 있으면 첫 태스크에서 지연 로드
+_PRELOAD_LANGS = [c.strip() for c in (os.getenv("OCR_PRELOAD_LANGS") or "").split(",") if c.strip()]
+# 자식 프로세스에서 예열 추론이 끝난 뒤 생성되는 readiness 파일 (docker healthcheck용)
+_READY_FILE = os.getenv("WORKER_READY_FILE") or "/tmp/celery_worker_ready"
+
 class AreaPayload(TypedDict):
     area_id: int
-    filename: str
     lang: str  # "EN" | "KO" | "JP"
+    x1: int
+    y1: int
+    x2: int
+    y2: int
+    filename: NotRequired[str]  # crop PNG (원본 없이 호출된 이전 payload 호환용)
+
+def _create_ocr(lang: str, batch_size: int) -> PaddleOCR:
+    """
+    text_recognition_batch_size는 한 이미지 안의 텍스트 줄만 묶으므로,
+    여러 crop을 한 번에 넘겼을 때 전처리/검출도 묶이도록 파이프라인 batch_size(기본 1)도 같이 설정.
+    (scripts/bench_ocr.py로 배치 크기별 처리량 비교)
+    """
+    config = load_pipeline_config("OCR")
+    config["batch_size"] = batch_size
+    return PaddleOCR(lang=lang, use_angle_cls=True, text_recognition_batch_size=batch_size, paddlex_config=config)
 
 @lru_cache(maxsize=8)
 def _get_ocr(lang: str) -> PaddleOCR:
     try:
         print(f"[DEBUG] Initializing OCR with lang='{lang}'")
-        return PaddleOCR(lang=lang, use_angle_cls=True)
+        return _create_ocr(lang, _BATCH_SIZE)
     except Exception as e:
         print(f"[ERROR] Failed to initialize OCR for lang={lang}: {e}")
         print("[DEBUG] Falling back to English OCR")
-        return PaddleOCR(lang="en", use_angle_cls=True)
+        return _create_ocr("en", _BATCH_SIZE)
+
+@worker_init.connect
+def _preload_ocr_models(**_: Any) -> None:
+    """
+    prefork 풀이 자식 프로세스를 만들기 전에(부모에서) OCR 모델 가중치만 로드.
+    자식들은 fork 시점의 메모리를 copy-on-write로 공유하므로 워커 수만큼 가중치를 복제하지 않음.
+    부모에서 추론(predict)을 돌리면 Paddle/OpenMP 스레드 풀이 생성되고, 이는 fork-safe하지 않아
+    자식의 첫 추론이 멈출 수 있으므로 예열은 자식에서(_warmup_ocr_models) 함.
+    """
+    if os.path.exists(_READY_FILE):
+        os.remove(_READY_FILE)
+
+    for code in _PRELOAD_LANGS:
+        lang = _to_paddle_lang(code)
+        print(f"[DEBUG] Preloading OCR model lang='{lang}'")
+        _get_ocr(lang)
 
-def _extract_text(filename: str, lang_code: str) -> str:
+    # 이후 GC가 로드된 객체들을 건드려 페이지가 복사되는 것을 방지
+    gc.collect()
+    gc.freeze()
+
+@worker_process_init.connect
+def _warmup_ocr_models(**_: Any) -> None:
+    """
+    fork된 자식에서 첫 추론(스레드 풀 생성 포함)을 미리 실행하고, 성공하면 readiness 파일 생성.
+    (예열 시간이 celery의 worker_proc_alive_timeout 안에 끝나야 함 — celery_app 설정 참고)
+    """
+    warmup = np.full((32, 96, 3), 255, dtype=np.uint8)
+    for code in _PRELOAD_LANGS:
+        lang = _to_paddle_lang(code)
+        try:
+            _get_ocr(lang).predict([warmup])
+        except Exception as e:
+            print(f"[ERROR] OCR warmup failed for lang={lang}: {e}")
+            return
+
+    with open(_READY_FILE, "w") as f:
+        f.write(",".join(_PRELOAD_LANGS))
+
+@worker_shutdown.connect
+def _clear_worker_ready(**_: Any) -> None:
+    if os.path.exists(_READY_FILE):
+        os.remove(_READY_FILE)
+
+def _to_paddle_lang(lang_code: Any) -> str:
     # Enum 들어오면 문자열로 변환
     if isinstance(lang_code, Enum):
         lang_code = lang_code.value
-    # 언어 스위치(필요 시 모델 여러 개 두는 대신 lang 바꿔 재생성도 가능)
-    lang = _LANG_MAP.get(lang_code, _DEFAULT)
-    ocr = _get_ocr(lang)  # 언어별 인스턴스 캐시
-    # 로컬에 임시 저장
-    image = storage.load_image(filename=filename, target="crop")
-    os.makedirs(IMAGE_BASE_DIR, exist_ok=True)
-    temp_filename = f"temp_ocr_{str(uuid.uuid4())}.png"
-    image_path = os.path.join(IMAGE_BASE_DIR, temp_filename)
-    image.save(image_path, format="PNG")
-    # ocr 가동
-    result = ocr.ocr(image_path) # pyright: ignore[reportDeprecated]
-    # 임시 저장한 이미지 파일 삭제
-    os.remove(image_path)
+    return _LANG_MAP.get(lang_code, _DEFAULT)
+
+def _to_ocr_input(image: PILImage.Image) -> np.ndarray:
+    """PIL 이미지를 PaddleOCR가 기대하는 BGR ndarray로 변환 (임시 파일 없이 메모리로 전달)."""
+    rgb = np.asarray(image.convert("RGB"))
+    return np.ascontiguousarray(rgb[:, :, ::-1])
+
+def _join_texts(result: Any) -> str:
     # 결과에서 텍스트만 이어붙이기 (필요 시 좌표/확신도 함께 저장)
     lines: List[str] = []
-    if result and result[0]:
-        ocr_result = result[0]
-        print(f"[DEBUG] OCR Raw Result:\n------confidence: {ocr_result['rec_scores']}\n------text: {ocr_result['rec_texts']}") # type: ignore
-        for txt in ocr_result['rec_texts']:
+    if result:
+        print(f"[DEBUG] OCR Raw Result:\n------confidence: {result['rec_scores']}\n------text: {result['rec_texts']}") # type: ignore
+        for txt in result['rec_texts']:
             lines.append(txt) # type: ignore
     return "\n".join(lines)
 
+def _iter_texts_batches(images: List[np.ndarray], lang: str, batch_size: int = _BATCH_SIZE) -> Iterator[List[str]]:
+    """같은 언어의 crop들을 batch_size 단위로 묶어 한 번에 추론. 배치마다 입력 순서대로 텍스트를 내보냄."""
+    ocr = _get_ocr(lang)  # 언어별 인스턴스 캐시
+    for start in range(0, len(images), batch_size):
+        chunk = images[start:start + batch_size]
+        results = ocr.predict(chunk)
+        yield [_join_texts(r) for r in results]
+
+def _slice_region(origin: np.ndarray, p: AreaPayload) -> np.ndarray:
+    """원본 BGR 배열에서 영역을 잘라냄 (PIL crop과 동일하게 이미지 밖은 잘라냄)."""
+    h, w = origin.shape[:2]
+    x1, x2 = max(0, min(p["x1"], w)), max(0, min(p["x2"], w))
+    y1, y2 = max(0, min(p["y1"], h)), max(0, min(p["y2"], h))
+    return np.ascontiguousarray(origin[y1:y2, x1:x2])
+
+def _iter_areas_texts(payloads: List[AreaPayload], origin_filename: str | None = None) -> Iterator[Dict[int, str]]:
+    """
+    서비스의 모든 영역을 언어별로 묶어 batch OCR 후, 배치가 끝날 때마다 area_id -> text 를 내보냄.
+    origin_filename이 있으면 원본을 한 번만 로드해 영역을 메모리에서 잘라 쓰고,
+    없으면 저장된 crop PNG를 읽음.
+    """
+    origin = _to_ocr_input(storage.load_image(origin_filename, "upload")) if origin_filename else None
+
+    groups: Dict[str, List[AreaPayload]] = defaultdict(list)
+    for p in payloads:
+        groups[_to_paddle_lang(p["lang"])].append(p)
+
+    for lang, group in groups.items():
+        images = [
+            _slice_region(origin, p) if origin is not None
+            else _to_ocr_input(storage.load_image(filename=p["filename"], target="crop"))
+            for p in group
+        ]
+
+        # 캐시 hit 영역은 바로 내보내고, miss 영역만 추론
+        keys = [ocr_cache_key(img, lang) for img in images]
+        cached = _ocr_cache.get_many(keys) if _ocr_cache else {}
+        hits = {p["area_id"]: cached[k] for p, k in zip(group, keys) if k in cached}
+        if hits:
+            print(f"[DEBUG] OCR cache hit: {len(hits)}/{len(group)} (lang={lang})")
+            yield hits
+
+        misses = [(p, img, k) for p, img, k in zip(group, images, keys) if k not in cached]
+        if not misses:
+            continue
+        done = 0
+        for texts in _iter_texts_batches([img for _, img, _ in misses], lang):
+            batch = misses[done:done + len(texts)]
+            if _ocr_cache:
+                _ocr_cache.set_many({k: text for (_, _, k), text in zip(batch, texts)})
+            yield {p["area_id"]: text for (p, _, _), text in zip(batch, texts)}
+            done += len(texts)
+
 @celery.task
-def extract_areas(payloads: List[AreaPayload], service_id: int) -> bool:
-    """Celery 워커에서 실행되는 동기 엔트리. 내부에서 async 실행."""
+def extract_areas(payloads: List[AreaPayload], service_id: int, origin_filename: str | None = None, reused: int = 0) -> bool:
+    """
+    Celery 워커에서 실행되는 동기 엔트리. 내부에서 async 실행.
+    reused: 이전 결과를 재사용해 OCR 대상에서 빠진 영역 수 (진행률을 status API와 같은 전체 영역 기준으로 알리기 위함)
+    """
     print(f"--------OCR TASK, Service: {service_id}")
     async def _run() -> bool:
         async with SessionLocal() as db:
-            for p in payloads:
-                text = _extract_text(p["filename"], p["lang"])
-                print(f"[DEBUG] Extracted Text: {text}")
-                area_in = AreaUpdate(id=p["area_id"], origin_text=text)
-                await update_area(db, area_in)
-
-            print(f"--------OCR 완료, Service Update")
-            service_in = ServiceUpdate(step=ServiceStep.DETECTING, status=ServiceStatus.PENDING)
-            await update_service(db, service_id, service_in)
+            try:
+                # 배치가 끝날 때마다 바로 기록해 status API가 중간 결과를 보여줄 수 있게 함
+                done, total = reused, reused + len(payloads)
+                for texts_by_area in _iter_areas_texts(payloads, origin_filename):
+                    areas_in = [AreaUpdate(id=area_id, origin_text=text, ocr_text=text) for area_id, text in texts_by_area.items()]
+                    print(f"[DEBUG] Extracted Texts: {[a.origin_text for a in areas_in]}")
+                    await update_areas_bulk(db, service_id, areas_in)
+
+                    done += len(areas_in)
+                    publish_service_event(service_id, ServiceStep.DETECTING, ServiceStatus.PROCESSING, done=done, total=total)
+
+                print(f"--------OCR 완료, Service Update")
+                service_in = ServiceUpdate(step=ServiceStep.DETECTING, status=ServiceStatus.PENDING)
+                await update_areas_bulk(db, service_id, [], service_in)
+                publish_service_event(service_id, ServiceStep.DETECTING, ServiceStatus.PENDING, done=total, total=total)
+            except Exception:
+                await mark_service_failed(db, service_id, ServiceStep.DETECTING)
+                raise
         return True
 
     return asyncio.run(_run())
@@ -6,18 +6,21 @@ from typing import TypedDict
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.constants.database_url import DATABASE_URL
-from app.crud.area import read_areas_bulk_by_service_id, update_area
-from app.crud.service import update_service
+from app.crud.area import read_areas_bulk_by_service_id, update_areas_bulk
 from app.models.enums.service import Language, ServiceStatus, ServiceStep
 from app.schemas.area import AreaUpdate
 from app.schemas.service import ServiceUpdate
-from app.utils.google_translate import translate_text
+from app.utils.service_events import mark_service_failed, publish_service_event
+from app.utils.translation_memory import TranslationMemory, build_translation_cache
+from app.utils.translator import build_translation_backend
 
 
 # --- 워커 전용 세션팩토리 ---
 _engine = create_async_engine(DATABASE_URL, future=True)
 SessionLocal = async_sessionmaker(_engine, expire_on_commit=False, class_=AsyncSession)
 
+translator = TranslationMemory(build_translation_backend(), build_translation_cache())
+
 
 class TranslatePayload(TypedDict):
   service_id: int
@@ -29,15 +32,30 @@ def translate_areas(payload: TranslatePayload, service_id: int) -> bool:
     """Celery 워커에서 실행되는 동기 엔트리. 내부에서 async 실행."""
     async def _run() -> bool:
       async with SessionLocal() as db:
-        areas = await read_areas_bulk_by_service_id(db, service_id)
-        
-        for area in areas:
-          translated_text = translate_text(payload["target_language"], payload["origin_language"], area.origin_text or '')
-          area_in = AreaUpdate(id=area.id, translated_text=translated_text)
-          await update_area(db, area_in)
-          
-        service_in = ServiceUpdate(step=ServiceStep.TRANSLATING, status=ServiceStatus.PENDING)
-        await update_service(db, service_id, service_in)
+        try:
+          areas = await read_areas_bulk_by_service_id(db, service_id)
+
+          total = len(areas)
+
+          # 서비스 전체를 한 번에 넘겨야 번역 메모리의 중복 제거가 서비스 단위로 동작하고,
+          # 백엔드(Google)는 요청당 최대 개수(MAX_SEGMENTS_PER_REQUEST)까지 꽉 채워 보냄
+          translated_texts = translator.translate_batch(
+            payload["target_language"],
+            payload["origin_language"],
+            [area.origin_text or '' for area in areas],
+          )
+
+          # 번역 결과 기록 + 서비스 step 전환을 한 트랜잭션으로
+          areas_in = [
+            AreaUpdate(id=area.id, translated_text=translated_text)
+            for area, translated_text in zip(areas, translated_texts)
+          ]
+          service_in = ServiceUpdate(step=ServiceStep.TRANSLATING, status=ServiceStatus.PENDING)
+          await update_areas_bulk(db, service_id, areas_in, service_in)
+          publish_service_event(service_id, ServiceStep.TRANSLATING, ServiceStatus.PENDING, done=total, total=total)
+        except Exception:
+          await mark_service_failed(db, service_id, ServiceStep.TRANSLATING)
+          raise
 
       return True
 
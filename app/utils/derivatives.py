@@ -0,0 +1,59 @@
+from __future__ import annotations
+from io import BytesIO
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from PIL import Image as PILImage
+
+from app.constants.image_path import DERIVATIVE_FORMATS, DERIVATIVE_QUALITY, DERIVATIVE_WIDTHS
+
+_EXTENSIONS = {"webp": "webp", "jpeg": "jpg"}
+_DERIVATIVE_NAME = re.compile(rf"_w\d+\.(?:{'|'.join(sorted(set(_EXTENSIONS.values())))})$")
+
+def derivative_filename(filename: str, width: int, fmt: str) -> str:
+    """abc.png -> abc_w640.webp"""
+    return f"{Path(filename).stem}_w{width}.{_EXTENSIONS[fmt]}"
+
+def is_derivative_filename(filename: str) -> bool:
+    """derivative_filename으로 만든 이름인지 (abc_w640.webp). 업로드/합성 파일명(uuid, composed_)과는 겹치지 않음."""
+    return bool(_DERIVATIVE_NAME.search(filename))
+
+def pick_width(requested: int) -> Optional[int]:
+    """요청 너비 이상인 것 중 가장 작은 파생 너비 (없으면 가장 큰 것). 설정된 너비가 없으면 None."""
+    if not DERIVATIVE_WIDTHS:
+        return None
+    for width in DERIVATIVE_WIDTHS:
+        if width >= requested:
+            return width
+    return DERIVATIVE_WIDTHS[-1]
+
+def _encode(img: PILImage.Image, fmt: str) -> bytes:
+    buf = BytesIO()
+    if fmt == "jpeg":
+        # JPEG는 알파가 없으므로 흰 배경에 합성
+        background = PILImage.new("RGB", img.size, "white")
+        background.paste(img, mask=img.getchannel("A") if img.mode == "RGBA" else None)
+        background.save(buf, format="JPEG", quality=DERIVATIVE_QUALITY, optimize=True, progressive=True)
+    else:
+        img.save(buf, format="WEBP", quality=DERIVATIVE_QUALITY, method=4)
+    return buf.getvalue()
+
+def render_derivatives(img: PILImage.Image, filename: str, widths: List[int] = DERIVATIVE_WIDTHS) -> Dict[str, bytes]:
+    """
+    설정된 너비/형식별 파생 이미지 생성 -> {파생 파일명: 인코딩된 바이트}.
+    원본보다 큰 너비는 확대하지 않고 원본 크기로 인코딩 (요청 너비와 무관하게 항상 파일이 존재하도록).
+    """
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA")
+    outputs: Dict[str, bytes] = {}
+    for width in widths:
+        if width < img.width:
+            height = max(1, round(img.height * width / img.width))
+            resized = img.resize((width, height), PILImage.Resampling.LANCZOS)
+        else:
+            resized = img
+        for fmt in DERIVATIVE_FORMATS:
+            if fmt in _EXTENSIONS:
+                outputs[derivative_filename(filename, width, fmt)] = _encode(resized, fmt)
+    return outputs
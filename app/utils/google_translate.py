@@ -1,4 +1,5 @@
-from typing import cast
+from functools import lru_cache
+from typing import List, cast
 from google.cloud import translate_v2 # pyright: ignore[reportMissingTypeStubs]
 
 from app.models.enums.service import Language 
@@ -9,13 +10,22 @@ language_converter: dict[Language, str] = {
   Language.KO: 'ko',
 }
 
+# Basic(v2) API 권장 한도: 요청당 최대 128개 문자열, 약 5K자
+MAX_SEGMENTS_PER_REQUEST = 128
+MAX_CHARS_PER_REQUEST = 5000
+
+@lru_cache(maxsize=1)
+def get_client() -> translate_v2.Client:
+    """워커(프로세스)당 하나의 Client를 재사용. fork 이후 첫 호출 시 생성됨."""
+    return translate_v2.Client()
+
 def translate_text(target: Language, source: Language, text: str) -> str:
     """Translates text into the target language.
 
     Target must be an ISO 639-1 language code.
     See https://g.co/cloud/translate/v2/translate-reference#supported_languages
     """
-    translate_client = translate_v2.Client()
+    translate_client = get_client()
 
     if isinstance(text, bytes):
       text = text.decode("utf-8")
@@ -34,4 +44,40 @@ def translate_text(target: Language, source: Language, text: str) -> str:
     print("Text: {}".format(result["input"]))
     print("Translation: {}".format(result["translatedText"]))
 
-    return result["translatedText"]
\ No newline at end of file
+    return result["translatedText"]
+
+def _chunk(texts: List[str]) -> List[List[str]]:
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    chars = 0
+    for text in texts:
+      if current and (len(current) >= MAX_SEGMENTS_PER_REQUEST or chars + len(text) > MAX_CHARS_PER_REQUEST):
+        chunks.append(current)
+        current, chars = [], 0
+      current.append(text)
+      chars += len(text)
+    if current:
+      chunks.append(current)
+    return chunks
+
+def translate_texts(target: Language, source: Language, texts: List[str]) -> List[str]:
+    """여러 문자열을 API 한도에 맞춰 묶어서 번역. 입력 순서대로 결과 반환 (빈 문자열은 호출 없이 그대로)."""
+    translate_client = get_client()
+
+    results = list(texts)
+    pending = [i for i, text in enumerate(texts) if text]
+    offset = 0
+    for chunk in _chunk([texts[i] for i in pending]):
+      translated = cast(
+        List[dict[str, str]],
+        translate_client.translate(  # pyright: ignore[reportUnknownMemberType]
+          chunk,
+          target_language=language_converter[target],
+          source_language=language_converter[source],
+        )
+      )
+      for result in translated:
+        results[pending[offset]] = result["translatedText"]
+        offset += 1
+
+    return results
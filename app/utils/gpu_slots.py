@@ -0,0 +1,202 @@
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+
+from __future__ import annotations
+import logging
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+import redis
+
+from app.utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class GPUSlot:
+    host: str
+    device: str
+    capacity: int = 1  # 한 장치에서 동시에 돌릴 수 있는 작업 수
+
+    @property
+    def name(self) -> str:
+        return f"{self.host}:{self.device}"
+
+@dataclass(frozen=True)
+class GPULease:
+    slot: GPUSlot
+    lease_id: str
+
+def parse_gpu_slots(spec: str, default_host: Optional[str] = None) -> List[GPUSlot]:
+    """
+    "host:device[:capacity],..." 형식 파싱. host를 생략한 "7" 같은 항목은 default_host(GPU_HOST) 사용.
+    예) GPU_SLOTS="gpu1:0,gpu1:1,gpu2:0:2"
+    """
+    slots: List[GPUSlot] = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        parts = item.split(":")
+        if len(parts) == 1:
+            host, device, capacity = default_host, parts[0], "1"
+        elif len(parts) == 2:
+            host, device, capacity = parts[0], parts[1], "1"
+        else:
+            host, device, capacity = parts[0], parts[1], parts[2]
+        if not host:
+            raise ValueError(f"GPU_SLOTS 항목의 호스트를 알 수 없습니다: {item}")
+        slots.append(GPUSlot(host=host, device=device, capacity=max(1, int(capacity))))
+    if not slots:
+        raise ValueError("GPU_SLOTS에 슬롯이 하나도 없습니다.")
+    return slots
+
+# 만료된 임대를 정리한 뒤 (사용량 / 용량)이 가장 낮은 빈 슬롯에 원자적으로 임대를 추가.
+# KEYS: 슬롯별 sorted set (member=lease_id, score=만료 시각)
+# ARGV: lease_id, lease_seconds, capacity_1, capacity_2, ...
+_ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local best, best_load = nil, nil
+for i, key in ipairs(KEYS) do
+  redis.call('ZREMRANGEBYSCORE', key, '-inf', now)
+  local used = redis.call('ZCARD', key)
+  local capacity = tonumber(ARGV[i + 2])
+  if used < capacity then
+    local load = used / capacity
+    if best_load == nil or load < best_load then
+      best, best_load = i, load
+    end
+  end
+end
+if best == nil then
+  return 0
+end
+redis.call('ZADD', KEYS[best], now + tonumber(ARGV[2]), ARGV[1])
+redis.call('EXPIRE', KEYS[best], math.ceil(tonumber(ARGV[2])) + 60)
+return best
+"""
+
+# 임대가 아직 살아 있으면(만료로 정리되지 않았으면) 만료 시각을 연장. 획득 스크립트와 같은 Redis 시계를 사용
+# KEYS: 슬롯 sorted set / ARGV: lease_id, lease_seconds
+_RENEW_SCRIPT = """
+if not redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+  return 0
+end
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+redis.call('ZADD', KEYS[1], now + tonumber(ARGV[2]), ARGV[1])
+redis.call('EXPIRE', KEYS[1], math.ceil(tonumber(ARGV[2])) + 60)
+return 1
+"""
+
+class GPUSlotScheduler:
+    """
+    설정된 (host, device) 슬롯 풀에서 Redis 임대(lease)를 발급하는 스케줄러.
+    - 임대는 만료 시각을 가지므로 워커가 죽어도 슬롯이 영구히 묶이지 않음
+    - 가장 덜 사용 중인 빈 슬롯을 고르고, 모두 사용 중이면 빈 슬롯이 생길 때까지 대기
+    - lease()로 잡은 임대는 작업이 끝날 때까지 백그라운드에서 계속 연장되므로 작업 시간이 TTL보다 길어도 슬롯이 중복 배정되지 않음
+    워커/API 어디서든 같은 Redis를 보므로 utilization()으로 슬롯별 사용량을 조회할 수 있음.
+    """
+    def __init__(self, slots: List[GPUSlot], lease_seconds: int = 3600, poll_interval: float = 0.5):
+        self.slots = slots
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self._script: Any = None
+        self._renew_script: Any = None
+
+    def _key(self, slot: GPUSlot) -> str:
+        return f"gpu:slot:{slot.name}:leases"
+
+    def try_acquire(self) -> Optional[GPULease]:
+        r = get_redis()
+        if self._script is None:
+            self._script = r.register_script(_ACQUIRE_SCRIPT)
+        lease_id = secrets.token_hex(8)
+        index = int(self._script(
+            keys=[self._key(s) for s in self.slots],
+            args=[lease_id, self.lease_seconds, *[s.capacity for s in self.slots]],
+        ))
+        if index == 0:
+            return None
+        return GPULease(slot=self.slots[index - 1], lease_id=lease_id)
+
+    def acquire(self, timeout: float = 3600) -> GPULease:
+        deadline = time.time() + timeout
+        while True:
+            lease = self.try_acquire()
+            if lease:
+                return lease
+            if time.time() >= deadline:
+                raise TimeoutError("사용 가능한 GPU 슬롯이 없습니다.")
+            time.sleep(self.poll_interval)
+
+    def renew(self, lease: GPULease) -> bool:
+        """만료 전에 임대 기간 연장. 이미 만료되어 정리된 임대면 False."""
+        r = get_redis()
+        if self._renew_script is None:
+            self._renew_script = r.register_script(_RENEW_SCRIPT)
+        return bool(self._renew_script(keys=[self._key(lease.slot)], args=[lease.lease_id, self.lease_seconds]))
+
+    def _keep_alive(self, lease: GPULease, stop: threading.Event) -> None:
+        while not stop.wait(self.lease_seconds / 3):
+            try:
+                if not self.renew(lease):
+                    logger.error("GPU lease expired while in use (%s)", lease.slot.name)
+                    return
+            except redis.RedisError:
+                logger.exception("GPU lease renew failed (%s)", lease.slot.name)
+
+    def release(self, lease: GPULease) -> None:
+        try:
+            get_redis().zrem(self._key(lease.slot), lease.lease_id)
+        except redis.RedisError:
+            # 해제 실패 시에도 임대는 만료 시각에 자동 정리됨
+            logger.exception("GPU lease release failed (%s)", lease.slot.name)
+
+    @contextmanager
+    def lease(self, timeout: float = 3600) -> Iterator[GPUSlot]:
+        held = self.acquire(timeout)
+        stop = threading.Event()
+        keeper = threading.Thread(target=self._keep_alive, args=(held, stop), daemon=True)
+        keeper.start()
+        try:
+            yield held.slot
+        finally:
+            stop.set()
+            keeper.join()
+            self.release(held)
+
+    def utilization(self) -> List[Dict[str, Any]]:
+        r = get_redis()
+        now = time.time()
+        pipe = r.pipeline(transaction=False)
+        for slot in self.slots:
+            pipe.zcount(self._key(slot), now, "+inf")
+        counts = pipe.execute()
+        return [
+            {
+                "slot": slot.name,
+                "host": slot.host,
+                "device": slot.device,
+                "capacity": slot.capacity,
+                "in_use": int(used),
+                "utilization": round(int(used) / slot.capacity, 3),
+            }
+            for slot, used in zip(self.slots, counts)
+        ]
+
+def build_gpu_scheduler() -> GPUSlotScheduler:
+    """
+    GPU_SLOTS 미지정 시 기존 동작(GPU_HOST의 7번 장치 하나)과 동일.
+    임대는 사용 중 계속 연장되므로 TTL은 워커가 죽었을 때 슬롯이 풀리기까지의 시간만 결정.
+    """
+    spec = os.getenv("GPU_SLOTS") or "7"
+    return GPUSlotScheduler(
+        parse_gpu_slots(spec, default_host=os.getenv("GPU_HOST")),
+        lease_seconds=int(os.getenv("GPU_SLOT_LEASE_SECONDS") or "120"),
+    )
@@ -0,0 +1,90 @@
+from __future__ import annotations
+import os
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Dict, Optional, Tuple
+
+from PIL import Image as PILImage
+
+# 원본 바이트를 그대로 보관해도 되는 형식 (브라우저가 바로 표시 가능) -> 확장자
+_KEEPABLE_FORMATS = {"PNG": "png", "JPEG": "jpg", "WEBP": "webp"}
+_EXIF_ORIENTATION = 0x0112
+
+@dataclass(frozen=True)
+class EncodingPolicy:
+    """
+    저장 대상(upload/crop/compose)별 인코딩 정책.
+    - format: "png" | "webp" (webp는 무손실)
+    - png_level: PNG zlib 압축 레벨 (0~9, 낮을수록 빠르고 큼. Pillow 기본값은 6)
+    - drop_alpha: 알파가 전부 불투명이면 RGB로 저장
+    - keep_original: 업로드가 이미 표시 가능한 형식이면 재인코딩 없이 원본 바이트 저장
+    """
+    format: str = "png"
+    png_level: int = 6
+    drop_alpha: bool = False
+    keep_original: bool = False
+
+    @property
+    def extension(self) -> str:
+        return "webp" if self.format == "webp" else "png"
+
+def parse_policy(spec: str) -> EncodingPolicy:
+    """ "png:level=1,drop_alpha,keep_original" / "webp:drop_alpha" 형식 파싱."""
+    fmt, _, options = spec.partition(":")
+    fmt = fmt.strip().lower() or "png"
+    if fmt not in ("png", "webp"):
+        raise ValueError(f"지원하지 않는 이미지 저장 형식: {fmt}")
+    flags: Dict[str, str] = {}
+    for option in options.split(","):
+        key, _, value = option.strip().partition("=")
+        if key:
+            flags[key] = value
+    return EncodingPolicy(
+        format=fmt,
+        png_level=int(flags.get("level") or "6"),
+        drop_alpha="drop_alpha" in flags,
+        keep_original="keep_original" in flags,
+    )
+
+_DEFAULT_SPECS = {
+    "upload": "png:level=1,drop_alpha,keep_original",
+    "crop": "png:level=1,drop_alpha",
+    "compose": "png:level=6,drop_alpha",
+}
+
+def policy_for(target: str) -> EncodingPolicy:
+    """IMAGE_ENCODING_UPLOAD / IMAGE_ENCODING_CROP / IMAGE_ENCODING_COMPOSE (미지정 시 기본 정책)."""
+    spec = os.getenv(f"IMAGE_ENCODING_{target.upper()}") or _DEFAULT_SPECS.get(target) or "png"
+    return parse_policy(spec)
+
+def is_opaque(img: PILImage.Image) -> bool:
+    if img.mode in ("RGB", "L", "CMYK", "YCbCr"):
+        return True
+    if img.mode in ("RGBA", "LA"):
+        return img.getchannel("A").getextrema() == (255, 255)
+    return False
+
+def encode_image(img: PILImage.Image, policy: EncodingPolicy) -> Tuple[bytes, str]:
+    """정책대로 인코딩 -> (바이트, 확장자)."""
+    if policy.drop_alpha and img.mode in ("RGBA", "LA") and is_opaque(img):
+        img = img.convert("RGB" if img.mode == "RGBA" else "L")
+    buf = BytesIO()
+    if policy.format == "webp":
+        img.save(buf, format="WEBP", lossless=True, method=4)
+    else:
+        img.save(buf, format="PNG", compress_level=policy.png_level)
+    return buf.getvalue(), policy.extension
+
+def keepable_extension(img: PILImage.Image) -> Optional[str]:
+    """
+    원본 바이트를 그대로 저장해도 되는지 판단해 확장자 반환 (아니면 None).
+    EXIF 회전 정보가 있으면 브라우저 표시와 픽셀 좌표(영역 bbox)가 어긋나므로 재인코딩 대상.
+    """
+    extension = _KEEPABLE_FORMATS.get(img.format or "")
+    if not extension:
+        return None
+    if img.getexif().get(_EXIF_ORIENTATION, 1) != 1:
+        return None
+    if getattr(img, "is_animated", False):
+        return None
+    return extension
@@ -0,0 +1,31 @@
+from __future__ import annotations
+import hashlib
+from typing import BinaryIO
+
+from PIL import Image as PILImage
+
+def content_hash(fp: BinaryIO, chunk_size: int = 1024 * 1024) -> str:
+    """업로드 원본 바이트의 SHA-256 (바이트 단위로 같은 파일 판별용)."""
+    fp.seek(0)
+    digest = hashlib.sha256()
+    while chunk := fp.read(chunk_size):
+        digest.update(chunk)
+    fp.seek(0)
+    return digest.hexdigest()
+
+def perceptual_hash(img: PILImage.Image, hash_size: int = 8) -> str:
+    """
+    dHash: (hash_size+1) x hash_size 흑백 축소 후 가로로 인접한 픽셀의 밝기 비교 -> 64bit hex.
+    재인코딩(JPEG<->PNG), 메타데이터 차이 등 눈으로 같은 이미지는 같은 값이 나옴.
+    모든 모드(P/RGBA/CMYK/...)를 RGB -> L 한 경로로 변환해, 업로드 형식/경로에 따라 값이 달라지지 않도록 함.
+    """
+    gray = img if img.mode == "L" else img.convert("RGB").convert("L")
+    small = gray.resize((hash_size + 1, hash_size), PILImage.Resampling.LANCZOS)
+    pixels = list(small.getdata())
+    bits = 0
+    for row in range(hash_size):
+        for col in range(hash_size):
+            left = pixels[row * (hash_size + 1) + col]
+            right = pixels[row * (hash_size + 1) + col + 1]
+            bits = (bits << 1) | int(left > right)
+    return f"{bits:0{hash_size * hash_size // 4}x}"
@@ -0,0 +1,192 @@
+from __future__ import annotations
+from email.parser import BytesParser
+import http.client
+import json
+import secrets
+import socket
+import threading
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
+from urllib.parse import urlsplit
+
+from PIL import Image as PILImage
+
+@dataclass
+class ComposeJob:
+    job_id: str
+    image: PILImage.Image
+    # [{"bbox": [x1, y1, x2, y2], "source_text": str, "target_text": str}, ...]
+    areas: List[Dict[str, Any]] = field(default_factory=list)
+    # 스케줄러가 배정한 GPU 장치 번호 (CUDA_VISIBLE_DEVICES 값)
+    device: Optional[str] = None
+
+    def meta(self) -> Dict[str, Any]:
+        meta: Dict[str, Any] = {"job_id": self.job_id, "areas": self.areas}
+        if self.device is not None:
+            meta["device"] = self.device
+        return meta
+
+class ComposeBackend(Protocol):
+    def compose(self, job: ComposeJob) -> PILImage.Image: ...
+    def compose_batch(self, jobs: List[ComposeJob]) -> List[PILImage.Image]: ...
+
+def encode_png(img: PILImage.Image) -> bytes:
+    buf = BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+def encode_multipart(fields: Dict[str, str], files: Dict[str, Tuple[str, bytes, str]]) -> Tuple[bytes, str]:
+    """multipart/form-data 본문 생성 (requests 없이 http.client로 보내기 위함)."""
+    boundary = f"----tmoji{secrets.token_hex(12)}"
+    parts: List[bytes] = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n'
+            f"Content-Type: application/json; charset=utf-8\r\n\r\n".encode("utf-8")
+            + value.encode("utf-8") + b"\r\n"
+        )
+    for name, (filename, data, content_type) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n".encode("utf-8")
+            + data + b"\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n".encode("utf-8"))
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+def decode_multipart(data: bytes, content_type: str) -> List[bytes]:
+    """multipart/* 응답 본문을 파트별 바이트로 분리 (순서 유지)."""
+    message = BytesParser().parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + data)
+    if not message.is_multipart():
+        raise ValueError("multipart 응답이 아닙니다.")
+    return [part.get_payload(decode=True) for part in message.get_payload()]  # pyright: ignore
+
+@dataclass
+class RegionPatch:
+    """영역 단위 전송용 작은 작업. box는 원본에서 잘라낸 범위(여백 포함), inner는 실제 영역(패치 좌표계)."""
+    job: ComposeJob
+    box: Tuple[int, int, int, int]
+    inner: Tuple[int, int, int, int]
+
+def split_into_regions(job: ComposeJob, margin: int) -> List[RegionPatch]:
+    """
+    전체 이미지 대신 영역마다 (영역 + 주변 여백 margin px)만 잘라서 개별 작업으로 만듦.
+    여백은 모델이 배경/글자 스타일을 참고하기 위한 문맥으로만 쓰이고, 붙여넣을 때는 영역 부분만 사용.
+    """
+    width, height = job.image.size
+    patches: List[RegionPatch] = []
+    for i, area in enumerate(job.areas):
+        x1, y1, x2, y2 = (int(v) for v in area["bbox"])
+        box = (max(0, x1 - margin), max(0, y1 - margin), min(width, x2 + margin), min(height, y2 + margin))
+        inner = (x1 - box[0], y1 - box[1], x2 - box[0], y2 - box[1])
+        sub_job = ComposeJob(
+            job_id=f"{job.job_id}_r{i}",
+            image=job.image.crop(box),
+            areas=[{**area, "bbox": list(inner)}],
+            device=job.device,
+        )
+        patches.append(RegionPatch(job=sub_job, box=box, inner=inner))
+    return patches
+
+def paste_regions(origin: PILImage.Image, patches: List[RegionPatch], results: List[PILImage.Image]) -> PILImage.Image:
+    """다시 그려진 패치들의 영역 부분만 원본에 붙여넣음 (여백끼리 겹쳐도 이웃 영역을 덮어쓰지 않음)."""
+    composed = origin.copy()
+    for patch, result in zip(patches, results):
+        box_size = (patch.box[2] - patch.box[0], patch.box[3] - patch.box[1])
+        if result.size != box_size:
+            result = result.resize(box_size)
+        if result.mode != composed.mode:
+            result = result.convert(composed.mode)
+        composed.paste(result.crop(patch.inner), (patch.box[0] + patch.inner[0], patch.box[1] + patch.inner[1]))
+    return composed
+
+# (host, port) -> 소켓처럼 동작하는 객체 (예: SSH direct-tcpip 채널)
+TunnelFactory = Callable[[str, int], Any]
+
+class HTTPInferenceBackend:
+    """
+    GPU 서버에 상주하는 추론 서버(FastAPI)와 HTTP로 통신.
+    POST {base_url}/infer  (multipart: job=JSON, image=PNG) -> 200 image/png
+    모델은 서버 기동 시 한 번만 로드되므로 작업마다 모델 로딩 비용이 들지 않음.
+    tunnel이 주어지면 base_url의 호스트/포트를 SSH 포워딩 채널로 연결 (URL이 GPU 서버 기준 주소일 때).
+    """
+    def __init__(self, base_url: str, timeout: float = 600.0, tunnel: Optional[TunnelFactory] = None):
+        parts = urlsplit(base_url)
+        if parts.scheme != "http":
+            raise ValueError("GPU_FASTAPI_URL은 http:// 주소여야 합니다.")
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.base_path = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.tunnel = tunnel
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            if self.tunnel:
+                # SSH 채널은 기본이 무기한 블로킹이므로 HTTP 타임아웃을 채널에도 적용 (응답 없는 서버에서 워커가 멈추지 않도록)
+                channel = self.tunnel(self.host, self.port)
+                channel.settimeout(self.timeout)
+                conn.sock = channel
+            self._conn = conn
+        return self._conn
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+        self._conn = None
+
+    def post(self, path: str, body: bytes, content_type: str) -> Tuple[bytes, str]:
+        """keep-alive 연결을 재사용하고, 끊긴 연결이면 한 번 재연결해 재시도."""
+        headers = {"Content-Type": content_type, "Content-Length": str(len(body))}
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    conn = self._connection()
+                    conn.request("POST", f"{self.base_path}{path}", body=body, headers=headers)
+                    resp = conn.getresponse()
+                    data = resp.read()
+                except socket.timeout:
+                    # 서버가 응답하지 않는 경우는 재시도하면 대기 시간만 두 배가 되므로 바로 실패
+                    self._close()
+                    raise
+                except (http.client.HTTPException, socket.error, EOFError):
+                    self._close()
+                    if attempt == 1:
+                        raise
+                    continue
+                if resp.status != 200:
+                    raise RuntimeError(f"Inference server failed ({resp.status}): {data[:500]!r}")
+                if resp.will_close:
+                    self._close()
+                return data, resp.getheader("Content-Type") or ""
+        raise RuntimeError("unreachable")
+
+    def compose(self, job: ComposeJob) -> PILImage.Image:
+        body, content_type = encode_multipart(
+            {"job": json.dumps(job.meta(), ensure_ascii=False)},
+            {"image": ("input.png", encode_png(job.image), "image/png")},
+        )
+        data, _ = self.post("/infer", body, content_type)
+        return PILImage.open(BytesIO(data))
+
+    def compose_batch(self, jobs: List[ComposeJob]) -> List[PILImage.Image]:
+        """
+        여러 작업을 한 요청으로 전송.
+        POST {base_url}/infer/batch  (multipart: jobs=JSON 배열, image_{i}=PNG) -> 200 multipart/mixed (입력 순서대로 PNG)
+        """
+        body, content_type = encode_multipart(
+            {"jobs": json.dumps([job.meta() for job in jobs], ensure_ascii=False)},
+            {f"image_{i}": (f"{job.job_id}.png", encode_png(job.image), "image/png") for i, job in enumerate(jobs)},
+        )
+        data, resp_type = self.post("/infer/batch", body, content_type)
+        parts = decode_multipart(data, resp_type)
+        if len(parts) != len(jobs):
+            raise RuntimeError(f"Inference server returned {len(parts)} results for {len(jobs)} jobs")
+        return [PILImage.open(BytesIO(part)) for part in parts]
@@ -0,0 +1,31 @@
+from __future__ import annotations
+import hashlib
+import os
+from typing import Dict, Optional
+
+import numpy as np
+
+from app.utils.redis_cache import RedisLRUCache
+
+OCR_CACHE_NAMESPACE = "ocr"
+OCR_CACHE_TTL = int(os.getenv("OCR_CACHE_TTL") or str(60 * 60 * 24 * 30))
+OCR_CACHE_MAX_ENTRIES = int(os.getenv("OCR_CACHE_MAX_ENTRIES") or "100000")
+
+def ocr_cache_key(pixels: np.ndarray, lang: str) -> str:
+    """crop 픽셀 버퍼(+shape) + 언어 코드의 blake2b 해시. 같은 픽셀이면 어느 서비스/재시도에서든 같은 키."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(pixels.shape).encode("ascii"))
+    digest.update(np.ascontiguousarray(pixels).data)
+    return f"{lang}:{digest.hexdigest()}"
+
+def _ocr_cache() -> RedisLRUCache:
+    return RedisLRUCache(OCR_CACHE_NAMESPACE, OCR_CACHE_MAX_ENTRIES, OCR_CACHE_TTL)
+
+def build_ocr_cache() -> Optional[RedisLRUCache]:
+    if (os.getenv("OCR_CACHE_ENABLED") or "true").lower() != "true":
+        return None
+    return _ocr_cache()
+
+def ocr_cache_stats() -> Dict[str, int]:
+    """워커와 같은 namespace의 hit/miss 및 항목 수 (API 헬스체크용, 캐시 비활성화 여부와 무관)."""
+    return _ocr_cache().stats()
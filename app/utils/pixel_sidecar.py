@@ -0,0 +1,87 @@
+from __future__ import annotations
+import logging
+import os
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+from PIL import Image as PILImage
+
+logger = logging.getLogger(__name__)
+
+_SUFFIX = ".rgba.npy"
+
+def sidecar_path(path: Path) -> Path:
+    """원본 옆의 숨김 파일 (.a.png.rgba.npy) — 파일명 기반 조회/전송 대상에 섞이지 않도록."""
+    return path.with_name(f".{path.name}{_SUFFIX}")
+
+def source_path(side: Path) -> Path:
+    return side.with_name(side.name[1:-len(_SUFFIX)])
+
+def load_pixels(path: Path) -> Optional[np.ndarray]:
+    """
+    사이드카를 읽기 전용 메모리 맵으로 열어 (H, W, 4) uint8 배열 반환. 없거나 원본보다 오래됐으면 None.
+    같은 호스트의 모든 프로세스(API/워커)가 페이지 캐시를 공유하고, 슬라이스는 복사 없이 뷰로 얻음.
+    """
+    side = sidecar_path(path)
+    try:
+        if side.stat().st_mtime_ns < path.stat().st_mtime_ns:
+            return None
+        pixels = np.load(side, mmap_mode="r")
+        os.utime(side)  # LRU: 최근 사용 시각 갱신 (원본보다 새로운 mtime은 유지됨)
+    except (FileNotFoundError, ValueError, OSError):
+        return None
+    if pixels.ndim != 3 or pixels.shape[2] != 4 or pixels.dtype != np.uint8:
+        return None
+    return pixels
+
+def write_pixels(path: Path, img: PILImage.Image) -> None:
+    """RGBA 픽셀을 사이드카로 저장 (임시 파일에 쓴 뒤 교체). 실패해도 원본 로드에는 영향 없음."""
+    side = sidecar_path(path)
+    tmp = side.with_name(f"{side.name}.{os.getpid()}.tmp")
+    try:
+        rgba = img if img.mode == "RGBA" else img.convert("RGBA")
+        with open(tmp, "wb") as f:
+            np.save(f, np.asarray(rgba))
+        os.replace(tmp, side)
+    except OSError:
+        logger.exception("pixel sidecar write failed (%s)", path.name)
+        tmp.unlink(missing_ok=True)
+
+def remove_pixels(path: Path) -> None:
+    sidecar_path(path).unlink(missing_ok=True)
+
+def enforce_budget(dirs: Iterable[Path], max_bytes: int) -> None:
+    """
+    원본이 사라진 사이드카는 삭제하고, 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 것부터 삭제.
+    사이드카를 새로 쓸 때(디코드가 일어난 경우)만 호출되므로 디렉터리 스캔 비용은 디코드에 비해 작음.
+    """
+    entries = []
+    total = 0
+    for directory in dirs:
+        for side in directory.glob(f".*{_SUFFIX}"):
+            try:
+                st = side.stat()
+            except FileNotFoundError:
+                continue
+            if not source_path(side).exists():
+                side.unlink(missing_ok=True)
+                continue
+            entries.append((st.st_mtime, st.st_size, side))
+            total += st.st_size
+    if total <= max_bytes:
+        return
+    entries.sort()
+    for _, size, side in entries:
+        if total <= max_bytes:
+            break
+        side.unlink(missing_ok=True)
+        total -= size
+
+def image_from_pixels(pixels: np.ndarray) -> PILImage.Image:
+    """
+    메모리 맵 위에 그대로 얹은 읽기 전용 RGBA 이미지 (디코드/복사 없음).
+    crop()은 해당 영역만 복사하고, paste/ImageDraw 등 쓰기 시에는 PIL이 먼저 복사본을 만듦.
+    """
+    height, width = pixels.shape[:2]
+    return PILImage.frombuffer("RGBA", (width, height), pixels, "raw", "RGBA", 0, 1)
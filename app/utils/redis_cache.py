@@ -0,0 +1,84 @@
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+
+from __future__ import annotations
+import logging
+import time
+from typing import Dict, List
+
+import redis
+
+from app.utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+class RedisLRUCache:
+    """
+    Redis 문자열 캐시 + 최근 접근 시각 sorted set 인덱스.
+    - TTL: 마지막 접근 기준으로 갱신 (슬라이딩 만료)
+    - LRU: 항목 수가 max_entries를 넘으면 가장 오래 접근하지 않은 항목부터 삭제
+    - hit/miss 카운터 유지
+    Redis 장애 시에는 예외를 삼키고 전부 miss로 취급 (캐시는 파이프라인을 막지 않음).
+    """
+    def __init__(self, namespace: str, max_entries: int, ttl_seconds: int):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl = ttl_seconds
+        self._index = f"{namespace}:lru"
+        self._hits = f"{namespace}:stats:hits"
+        self._misses = f"{namespace}:stats:misses"
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:v:{key}"
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        if not keys:
+            return {}
+        try:
+            r = get_redis()
+            values = r.mget([self._key(k) for k in keys])
+            found = {k: v for k, v in zip(keys, values) if v is not None}
+
+            now = time.time()
+            pipe = r.pipeline(transaction=False)
+            for k in found:
+                pipe.expire(self._key(k), self.ttl)
+            if found:
+                pipe.zadd(self._index, {k: now for k in found})
+                pipe.incrby(self._hits, len(found))
+            if len(found) < len(keys):
+                pipe.incrby(self._misses, len(keys) - len(found))
+            pipe.execute()
+            return found
+        except redis.RedisError:
+            logger.exception("cache get failed (%s)", self.namespace)
+            return {}
+
+    def set_many(self, items: Dict[str, str]) -> None:
+        if not items:
+            return
+        try:
+            r = get_redis()
+            now = time.time()
+            pipe = r.pipeline(transaction=False)
+            for k, v in items.items():
+                pipe.set(self._key(k), v, ex=self.ttl)
+            pipe.zadd(self._index, {k: now for k in items})
+            pipe.zcard(self._index)
+            size = pipe.execute()[-1]
+
+            overflow = int(size) - self.max_entries
+            if overflow > 0:
+                evicted = [k for k, _ in r.zpopmin(self._index, overflow)]
+                if evicted:
+                    r.delete(*[self._key(k) for k in evicted])
+        except redis.RedisError:
+            logger.exception("cache set failed (%s)", self.namespace)
+
+    def stats(self) -> Dict[str, int]:
+        try:
+            r = get_redis()
+            hits, misses = r.mget([self._hits, self._misses])
+            return {"hits": int(hits or 0), "misses": int(misses or 0), "size": int(r.zcard(self._index))}
+        except redis.RedisError:
+            logger.exception("cache stats failed (%s)", self.namespace)
+            return {"hits": 0, "misses": 0, "size": 0}
@@ -0,0 +1,20 @@
+# pyright: reportUnknownMemberType=false
+
+import os
+from functools import lru_cache
+
+import redis
+import redis.asyncio
+
+# Celery 브로커(0)/결과(1)와 분리된 DB를 애플리케이션 캐시/이벤트 용도로 사용
+REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/2")
+
+@lru_cache(maxsize=1)
+def get_redis() -> redis.Redis:
+    """프로세스당 하나의 커넥션 풀 (fork 후에는 redis-py가 pid를 보고 풀을 새로 만듦)."""
+    return redis.Redis.from_url(REDIS_URL, decode_responses=True)
+
+@lru_cache(maxsize=1)
+def get_async_redis() -> redis.asyncio.Redis:
+    """API(uvicorn) 이벤트 루프에서 사용하는 비동기 클라이언트."""
+    return redis.asyncio.Redis.from_url(REDIS_URL, decode_responses=True)
@@ -0,0 +1,65 @@
+# pyright: reportUnknownMemberType=false
+
+import json
+import logging
+from typing import Any, Dict, Optional
+
+import redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.service import update_service
+from app.models.enums.service import ServiceStatus, ServiceStep
+from app.schemas.service import ServiceUpdate
+from app.utils.redis_client import get_async_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+def service_channel(service_id: int) -> str:
+    return f"service:{service_id}:events"
+
+def make_service_event(
+    service_id: int, step: ServiceStep, status: ServiceStatus, done: Optional[int] = None, total: Optional[int] = None
+) -> Dict[str, Any]:
+    event: Dict[str, Any] = {"serviceId": service_id, "step": ServiceStep(step).value, "status": ServiceStatus(status).value}
+    if total is not None:
+        event["done"] = done or 0
+        event["total"] = total
+    return event
+
+def publish_service_event(
+    service_id: int, step: ServiceStep, status: ServiceStatus, done: Optional[int] = None, total: Optional[int] = None
+) -> None:
+    """
+    Celery 태스크에서 서비스 step/status 변경(및 영역 진행률)을 SSE 구독자에게 알림.
+    실패해도 태스크는 계속 진행.
+    """
+    try:
+        event = make_service_event(service_id, step, status, done, total)
+        get_redis().publish(service_channel(service_id), json.dumps(event))
+    except redis.RedisError:
+        logger.exception("Failed to publish service event (service_id=%s)", service_id)
+
+async def publish_service_event_async(
+    service_id: int, step: ServiceStep, status: ServiceStatus, done: Optional[int] = None, total: Optional[int] = None
+) -> None:
+    """
+    API(이벤트 루프)에서 step/status를 바꾼 경우(작업 시작 등) 구독자에게 알림.
+    프로세스 공용 클라이언트를 쓰므로 닫지 않음 (닫으면 같은 풀의 SSE 구독 연결까지 끊김).
+    """
+    try:
+        event = make_service_event(service_id, step, status, done, total)
+        await get_async_redis().publish(service_channel(service_id), json.dumps(event))
+    except redis.RedisError:
+        logger.exception("Failed to publish service event (service_id=%s)", service_id)
+
+async def mark_service_failed(db: AsyncSession, service_id: int, step: ServiceStep) -> None:
+    """
+    태스크가 예외로 끝났을 때 서비스를 FAILED로 기록하고 알림 (SSE 스트림이 종료되도록).
+    원래 예외를 가리지 않도록 여기서 생긴 오류는 로그만 남김.
+    """
+    try:
+        await db.rollback()
+        await update_service(db, service_id, ServiceUpdate(step=step, status=ServiceStatus.FAILED))
+    except Exception:
+        logger.exception("Failed to mark service as FAILED (service_id=%s)", service_id)
+    publish_service_event(service_id, step, ServiceStatus.FAILED)
@@ -0,0 +1,114 @@
+# pyright: reportUnknownMemberType=false
+
+import logging
+import os
+import socket
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Set, Tuple
+
+import paramiko
+
+logger = logging.getLogger(__name__)
+
+class SSHConnectionPool:
+    """
+    워커 프로세스 하나가 원격 호스트 하나에 대해 유지하는 장기 SSH 연결.
+    - keep-alive 패킷으로 유휴 연결이 끊기지 않게 유지
+    - 사용 전 헬스체크, 실패/끊김 시 다음 사용에서 재연결
+    - SFTP 채널 재사용, 이미 존재하는 원격 디렉토리 캐시
+    prefork 자식이 부모의 소켓을 물려받은 경우(pid 변경) 부모 연결은 버리고 새로 연결함.
+    """
+    def __init__(self, connect: Callable[[], paramiko.SSHClient], keepalive_seconds: int = 30):
+        self._connect = connect
+        self._keepalive = keepalive_seconds
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+        self._client: Optional[paramiko.SSHClient] = None
+        self._sftp: Optional[paramiko.SFTPClient] = None
+        self._known_dirs: Set[str] = set()
+
+    def _is_alive(self) -> bool:
+        if self._client is None:
+            return False
+        transport = self._client.get_transport()
+        if transport is None or not transport.is_active() or not transport.is_authenticated():
+            return False
+        try:
+            transport.send_ignore()
+            return True
+        except (paramiko.SSHException, socket.error, EOFError):
+            return False
+
+    def _reset(self) -> None:
+        if self._pid != os.getpid():
+            # fork로 물려받은 연결은 부모 소유이므로 닫지 않고 버림
+            self._pid = os.getpid()
+            self._client, self._sftp = None, None
+            self._known_dirs.clear()
+            return
+        for closable in (self._sftp, self._client):
+            try:
+                if closable: closable.close()
+            except Exception:
+                pass
+        self._client, self._sftp = None, None
+        self._known_dirs.clear()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def client(self) -> paramiko.SSHClient:
+        with self._lock:
+            if self._pid != os.getpid() or not self._is_alive():
+                if self._client is not None:
+                    logger.info("SSH connection lost, reconnecting")
+                self._reset()
+                client = self._connect()
+                transport = client.get_transport()
+                if transport is not None:
+                    transport.set_keepalive(self._keepalive)
+                self._client = client
+            return self._client  # pyright: ignore[reportReturnType]
+
+    def sftp(self) -> paramiko.SFTPClient:
+        with self._lock:
+            client = self.client()
+            channel = self._sftp.get_channel() if self._sftp else None
+            if self._sftp is None or channel is None or channel.closed:
+                self._sftp = client.open_sftp()
+            return self._sftp
+
+    def open_tunnel(self, host: str, port: int) -> paramiko.Channel:
+        """원격 호스트 기준 (host, port)로 direct-tcpip 포워딩 채널을 엶 (ssh -L 과 동일)."""
+        with self._lock:
+            transport = self.client().get_transport()
+            if transport is None:
+                raise paramiko.SSHException("SSH transport is not available")
+            return transport.open_channel("direct-tcpip", (host, port), ("127.0.0.1", 0))
+
+    def mkdir_p(self, path: str) -> None:
+        """SFTP에는 -p가 없어서 재귀 생성. 확인된 디렉토리는 캐시해 다음 작업부터 왕복을 생략."""
+        sftp = self.sftp()
+        parts = [p for p in path.split("/") if p]
+        cur = "/"
+        for p in parts:
+            cur = os.path.join(cur, p)
+            if cur in self._known_dirs:
+                continue
+            try:
+                sftp.mkdir(cur)
+            except IOError:
+                sftp.stat(cur)  # 이미 존재하는 경우만 통과 (없으면 예외 전파)
+            self._known_dirs.add(cur)
+
+    @contextmanager
+    def session(self) -> Iterator[Tuple[paramiko.SSHClient, paramiko.SFTPClient]]:
+        """연결/SFTP 채널을 빌려줌. 전송 계층 오류가 나면 연결을 폐기해 다음 사용 시 재연결."""
+        with self._lock:
+            try:
+                yield self.client(), self.sftp()
+            except (paramiko.SSHException, socket.error, EOFError):
+                self._reset()
+                raise
@@ -1,43 +1,90 @@
 from __future__ import annotations
+import mimetypes
 import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Literal, Optional, Protocol
+from typing import Any, BinaryIO, Literal, Optional, Protocol, Set, Tuple
 
 from fastapi.responses import FileResponse, RedirectResponse, Response
 from PIL import Image as PILImage
 
-from app.constants.image_path import COMPOSE_DIR, CROP_DIR, IMAGE_BASE_DIR, UPLOAD_DIR
+from app.constants.image_path import ACCEL_REDIRECT_PREFIX, COMPOSE_DIR, CROP_DIR, DERIVED_DIR, IMAGE_BASE_DIR, IMAGE_CACHE_CONTROL, PIXEL_SIDECAR_ENABLED, PIXEL_SIDECAR_MAX_BYTES, PIXEL_SIDECAR_TARGETS, UPLOAD_DIR
+from app.core.executor import run_blocking
+from app.utils.image_encoding import encode_image, policy_for
+from app.utils import pixel_sidecar
 
-Target = Literal["upload", "compose", "crop"]
+Target = Literal["upload", "compose", "crop", "derived"]
+
+def media_type_for(filename: str) -> str:
+    """확장자로 Content-Type 결정 (썸네일 등 파생 이미지는 webp/jpeg)."""
+    return mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(목록, *, W/ 접두사 포함)가 etag와 일치하는지 (약한 비교)."""
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidates or etag.removeprefix("W/") in [c.removeprefix("W/") for c in candidates]
 
 class BaseStorage(Protocol):
     def save_png(self, img: PILImage.Image, filename: str, target: Target = "upload") -> None: ...
-    def get_image_response(self, filename: str, target: Target) -> Response: ...
+    def save_bytes(self, data: bytes, filename: str, target: Target = "upload") -> None: ...
+    def save_image(self, img: PILImage.Image, stem: str, target: Target = "upload") -> str: ...
+    def get_image_response(self, filename: str, target: Target, if_none_match: Optional[str] = None) -> Response: ...
     def load_image(self, filename: str, target: Target = "upload") -> PILImage.Image: ...
+    def load_bytes(self, filename: str, target: Target = "upload") -> bytes: ...
+
+class AsyncBaseStorage(Protocol):
+    """API(이벤트 루프)에서 사용하는 비동기 스토리지. 워커(Celery)는 동기 BaseStorage를 그대로 사용."""
+    async def save_png(self, img: PILImage.Image, filename: str, target: Target = "upload") -> None: ...
+    async def save_bytes(self, data: bytes, filename: str, target: Target = "upload") -> None: ...
+    async def save_image(self, img: PILImage.Image, stem: str, target: Target = "upload") -> str: ...
+    async def get_image_response(self, filename: str, target: Target, if_none_match: Optional[str] = None) -> Response: ...
+    async def load_image(self, filename: str, target: Target = "upload") -> PILImage.Image: ...
 
 # ---------------- Local ----------------
 class LocalStorage:
-    def __init__(self, image_base_dir: str, upload_dir: str, compose_dir: str, crop_dir: str):
+    def __init__(
+        self,
+        image_base_dir: str,
+        upload_dir: str,
+        compose_dir: str,
+        crop_dir: str,
+        derived_dir: str,
+        sidecar_targets: Optional[Set[str]] = None,
+        sidecar_max_bytes: int = 0,
+    ):
+        # 픽셀 사이드카(pixel_sidecar)를 사용할 대상 (None/빈 집합이면 사용 안 함)과 전체 용량 상한
+        self.sidecar_targets = sidecar_targets or set()
+        self.sidecar_max_bytes = sidecar_max_bytes
         self.image_base_dir = Path(image_base_dir).resolve()
         self.image_base_dir.mkdir(parents=True, exist_ok=True)
 
         self.upload_folder = Path(upload_dir)
         self.compose_folder = Path(compose_dir)
         self.crop_folder = Path(crop_dir)
+        self.derived_folder = Path(derived_dir)
 
         self.upload_dir = self.image_base_dir / self.upload_folder
         self.compose_dir = self.image_base_dir / self.compose_folder
         self.crop_dir = self.image_base_dir / self.crop_folder
+        self.derived_dir = self.image_base_dir / self.derived_folder
 
         self.upload_dir.mkdir(parents=True, exist_ok=True)
         self.compose_dir.mkdir(parents=True, exist_ok=True)
         self.crop_dir.mkdir(parents=True, exist_ok=True)
+        self.derived_dir.mkdir(parents=True, exist_ok=True)
     
     def get_path(self, target: Target) -> Path:
         base = self.compose_dir
         if target == "upload": base = self.upload_dir
         if target == "crop": base = self.crop_dir
+        if target == "derived": base = self.derived_dir
     
         return base
 
@@ -48,34 +95,136 @@ class LocalStorage:
             raise ValueError("잘못된 경로")
         return p
 
+    def _tmp_path(self, path: Path) -> Path:
+        return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
     def save_png(self, img: PILImage.Image, filename: str, target: Target = "upload") -> None:
         base = self.get_path(target)
         path = self._safe_path(base, filename)
-        img.save(path, format="PNG")
+        # 임시 파일에 쓴 뒤 교체 -> 읽는 쪽(캐시 포함)이 쓰다 만 파일을 보지 않도록
+        tmp = self._tmp_path(path)
+        img.save(tmp, format="PNG")
+        os.replace(tmp, path)
+        self._drop_sidecar(path, target)
 
-    def get_image_response(self, filename: str, target: Target) -> Response:
+    def save_bytes(self, data: bytes, filename: str, target: Target = "upload") -> None:
+        """이미 인코딩된 바이트를 그대로 저장 (형식은 파일 확장자로 구분)."""
         base = self.get_path(target)
         path = self._safe_path(base, filename)
-        if not path.exists():
+        tmp = self._tmp_path(path)
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        self._drop_sidecar(path, target)
+
+    def _drop_sidecar(self, path: Path, target: Target) -> None:
+        # 같은 이름으로 덮어쓴 경우 이전 픽셀이 읽히지 않도록 (다음 로드 때 다시 생성)
+        if target in self.sidecar_targets:
+            pixel_sidecar.remove_pixels(path)
+
+    def save_image(self, img: PILImage.Image, stem: str, target: Target = "upload") -> str:
+        """대상별 인코딩 정책(image_encoding.policy_for)으로 저장하고, 확장자가 붙은 최종 파일명 반환."""
+        data, extension = encode_image(img, policy_for(target))
+        filename = f"{stem}.{extension}"
+        self.save_bytes(data, filename, target)
+        return filename
+
+    def get_image_response(self, filename: str, target: Target, if_none_match: Optional[str] = None) -> Response:
+        """
+        저장된 파일명(UUID)은 한 번 쓰이면 바뀌지 않으므로 immutable 캐시 + 강한 ETag.
+        If-None-Match가 일치하면 304, Range 요청은 FileResponse가 206으로 처리.
+        ACCEL_REDIRECT_PREFIX가 있으면 파일 전송은 nginx(X-Accel-Redirect)에 맡김.
+        """
+        base = self.get_path(target)
+        path = self._safe_path(base, filename)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             from fastapi import HTTPException
             raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
-        headers = {"Content-Disposition": f'inline; filename="{Path(filename).name}"'}
-        return FileResponse(str(path), media_type="image/png", headers=headers)
+
+        # nginx 정적 파일 ETag와 같은 형식("mtime초(hex)-크기(hex)") -> X-Accel-Redirect 경로와 검증자가 일치
+        etag = f'"{int(st.st_mtime):x}-{st.st_size:x}"'
+        headers = {
+            "Content-Disposition": f'inline; filename="{path.name}"',
+            "Cache-Control": IMAGE_CACHE_CONTROL,
+            "ETag": etag,
+        }
+        if etag_matches(if_none_match, etag):
+            del headers["Content-Disposition"]
+            return Response(status_code=304, headers=headers)
+
+        if ACCEL_REDIRECT_PREFIX:
+            relative = path.relative_to(self.image_base_dir).as_posix()
+            headers["X-Accel-Redirect"] = f"{ACCEL_REDIRECT_PREFIX.rstrip('/')}/{relative}"
+            return Response(media_type=media_type_for(filename), headers=headers)
+
+        return FileResponse(str(path), media_type=media_type_for(filename), headers=headers, stat_result=st)
     
     def load_image(self, filename: str, target: Target = "upload") -> PILImage.Image:
-        """로컬 디스크에서 PIL 이미지 로드(RGBA로 변환)."""
+        """
+        로컬 디스크에서 PIL 이미지 로드(RGBA로 변환).
+        사이드카 대상이면 메모리 맵 픽셀을 디코드 없이 읽기 전용 이미지로 반환하고, 없으면 디코드 후 생성.
+        """
         base = self.get_path(target)
         path = self._safe_path(base, filename)
         if not path.exists():
             from fastapi import HTTPException
             raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+        use_sidecar = target in self.sidecar_targets
+        if use_sidecar:
+            pixels = pixel_sidecar.load_pixels(path)
+            if pixels is not None:
+                return pixel_sidecar.image_from_pixels(pixels)
         try:
-            return PILImage.open(path).convert("RGBA")
+            img = PILImage.open(path).convert("RGBA")
         except Exception:
             from fastapi import HTTPException
             raise HTTPException(status_code=500, detail="이미지 로드 실패")
+        if use_sidecar and img.width * img.height * 4 <= self.sidecar_max_bytes:
+            pixel_sidecar.write_pixels(path, img)
+            pixel_sidecar.enforce_budget(
+                [self.get_path(t) for t in self.sidecar_targets],  # pyright: ignore[reportArgumentType]
+                self.sidecar_max_bytes,
+            )
+        return img
+
+    def load_bytes(self, filename: str, target: Target = "upload") -> bytes:
+        """저장된 파일의 원본 바이트 (디코드 없이)."""
+        base = self.get_path(target)
+        path = self._safe_path(base, filename)
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            from fastapi import HTTPException
+            raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
 
 # ---------------- S3 ----------------
+MB = 1024 * 1024
+# 커넥션 풀 크기는 병렬 파트 전송 수 + 동시 요청 수보다 넉넉하게
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS") or "32")
+S3_MULTIPART_THRESHOLD = int(os.getenv("S3_MULTIPART_THRESHOLD_MB") or "8") * MB
+S3_MULTIPART_CHUNKSIZE = int(os.getenv("S3_MULTIPART_CHUNKSIZE_MB") or "8") * MB
+S3_TRANSFER_CONCURRENCY = int(os.getenv("S3_TRANSFER_CONCURRENCY") or "8")
+# 업로드/다운로드 버퍼가 이 크기를 넘으면 메모리 대신 임시 파일 사용
+S3_SPOOL_MAX_BYTES = int(os.getenv("S3_SPOOL_MAX_MB") or "16") * MB
+
+@lru_cache(maxsize=4)
+def get_s3_client(region: str, endpoint_url: Optional[str] = None) -> Any:
+    """프로세스 전체가 공유하는 S3 클라이언트 (boto3 클라이언트는 스레드 안전, 연결 풀 재사용)."""
+    import boto3 # pyright: ignore[reportMissingTypeStubs]
+    from botocore.config import Config # pyright: ignore[reportMissingTypeStubs]
+
+    return boto3.client( # pyright: ignore[reportUnknownMemberType]
+        "s3",
+        region_name=region,
+        endpoint_url=endpoint_url,
+        config=Config(
+            signature_version="s3v4",
+            max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+            retries={"max_attempts": 5, "mode": "adaptive"},
+        ),
+    )
+
 class S3Storage:
     def __init__(
         self,
@@ -84,23 +233,32 @@ class S3Storage:
         upload_prefix: str = "upload",
         compose_prefix: str = "compose",
         crop_prefix: str = "crop",
+        derived_prefix: str = "derived",
         presign_expires: int = 3600,
         endpoint_url: Optional[str] = None,
+        url_cache_ttl: Optional[int] = None,
+        url_cache_size: int = 10000,
     ):
         # boto3는 s3 모드에서만 필요하도록 지연 임포트
-        import boto3 # pyright: ignore[reportMissingTypeStubs]
-        from botocore.config import Config # pyright: ignore[reportMissingTypeStubs]
+        from boto3.s3.transfer import TransferConfig # pyright: ignore[reportMissingTypeStubs]
 
         self.bucket = bucket
         self.upload_prefix = upload_prefix.strip("/")
         self.compose_prefix = compose_prefix.strip("/")
         self.crop_prefix = crop_prefix.strip("/")
+        self.derived_prefix = derived_prefix.strip("/")
         self.expires = presign_expires
-        self.s3 = boto3.client( # pyright: ignore[reportUnknownMemberType]
-            "s3",
-            region_name=region,
-            endpoint_url=endpoint_url,
-            config=Config(signature_version="s3v4"),
+        # presigned URL 캐시: 만료 전에 충분한 여유(기본 유효 시간의 20%)를 두고 교체
+        self.url_cache_ttl = min(url_cache_ttl or presign_expires * 4 // 5, presign_expires * 4 // 5)
+        self.url_cache_size = url_cache_size
+        self._url_cache: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self._url_lock = threading.Lock()
+        self.s3 = get_s3_client(region, endpoint_url)
+        self.transfer_config = TransferConfig(
+            multipart_threshold=S3_MULTIPART_THRESHOLD,
+            multipart_chunksize=S3_MULTIPART_CHUNKSIZE,
+            max_concurrency=S3_TRANSFER_CONCURRENCY,
+            use_threads=True,
         )
 
     def _key(self, target: Target, filename: str) -> str:
@@ -108,60 +266,157 @@ class S3Storage:
         prefix = self.compose_prefix
         if target == "upload": prefix = self.upload_prefix
         if target == "crop": prefix = self.crop_prefix
+        if target == "derived": prefix = self.derived_prefix
         return f"{prefix}/{name}"
 
-    def save_png(self, img: PILImage.Image, filename: str, target: Target = "upload") -> None:
-        buf = BytesIO()
-        img.save(buf, format="PNG")
-        buf.seek(0)
-        key = self._key(target, filename)
-        self.s3.put_object( # pyright: ignore[reportUnknownMemberType]
-            Bucket=self.bucket,
-            Key=key,
-            Body=buf.getvalue(),
-            ContentType="image/png",
+    def _upload(self, fileobj: BinaryIO, key: str, content_type: str) -> None:
+        """크기가 multipart 임계값을 넘으면 파트를 병렬 업로드 (boto3 managed transfer)."""
+        self.s3.upload_fileobj( # pyright: ignore[reportUnknownMemberType]
+            fileobj,
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": content_type, "CacheControl": IMAGE_CACHE_CONTROL},
+            Config=self.transfer_config,
         )
 
-    def get_image_response(self, filename: str, target: Target) -> Response:
+    def save_png(self, img: PILImage.Image, filename: str, target: Target = "upload") -> None:
+        # 인코딩 결과는 spool(작으면 메모리, 크면 임시 파일)에 쓰고 스트리밍 업로드
+        with tempfile.SpooledTemporaryFile(max_size=S3_SPOOL_MAX_BYTES) as buf:
+            img.save(buf, format="PNG")
+            buf.seek(0)
+            self._upload(buf, self._key(target, filename), "image/png") # pyright: ignore[reportArgumentType]
+
+    def save_bytes(self, data: bytes, filename: str, target: Target = "upload") -> None:
+        self._upload(BytesIO(data), self._key(target, filename), media_type_for(filename))
+
+    def save_image(self, img: PILImage.Image, stem: str, target: Target = "upload") -> str:
+        data, extension = encode_image(img, policy_for(target))
+        filename = f"{stem}.{extension}"
+        self.save_bytes(data, filename, target)
+        return filename
+
+    def _presigned_url(self, filename: str, target: Target) -> Tuple[str, int]:
+        """
+        (presigned URL, 남은 유효 시간) 반환. 같은 객체는 캐시 TTL 동안 같은 URL을 재사용해
+        서명 비용을 없애고 브라우저가 리다이렉트 대상을 캐시할 수 있게 함.
+        """
         key = self._key(target, filename)
-        # 존재 확인(선택)
-        try:
-            self.s3.head_object(Bucket=self.bucket, Key=key) # pyright: ignore[reportUnknownMemberType]
-        except Exception:
-            from fastapi import HTTPException
-            raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+        now = time.monotonic()
+        with self._url_lock:
+            cached = self._url_cache.get(key)
+            if cached and cached[1] > now:
+                self._url_cache.move_to_end(key)
+                return cached[0], int(cached[1] - now)
 
         params = {
             "Bucket": self.bucket,
             "Key": key,
-            "ResponseContentType": "image/png",
+            "ResponseContentType": media_type_for(filename),
             "ResponseContentDisposition": f'inline; filename="{Path(filename).name}"',
         }
         url = self.s3.generate_presigned_url("get_object", Params=params, ExpiresIn=self.expires) # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
-        return RedirectResponse(url, status_code=307) # pyright: ignore[reportUnknownArgumentType]
+        with self._url_lock:
+            self._url_cache[key] = (url, now + self.url_cache_ttl) # pyright: ignore[reportUnknownArgumentType]
+            self._url_cache.move_to_end(key)
+            while len(self._url_cache) > self.url_cache_size:
+                self._url_cache.popitem(last=False)
+        return url, self.url_cache_ttl # pyright: ignore[reportUnknownVariableType]
+
+    def get_image_response(self, filename: str, target: Target, if_none_match: Optional[str] = None) -> Response:
+        """
+        존재 여부는 호출 측이 images 테이블로 확인하므로 head_object 없이 바로 리다이렉트.
+        ETag/Range/304는 S3가 객체 기준으로 처리 (객체에 Cache-Control 메타데이터 저장).
+        """
+        url, remaining = self._presigned_url(filename, target)
+        # 리다이렉트도 URL이 유효한 동안(캐시 TTL 이내)만 브라우저에 캐시
+        headers = {"Cache-Control": f"private, max-age={remaining}"}
+        return RedirectResponse(url, status_code=307, headers=headers)
     
     def load_image(self, filename: str, target: Target = "upload") -> PILImage.Image:
         """S3에서 객체를 받아 PIL 이미지 로드(RGBA로 변환)."""
         key = self._key(target, filename)
+        from botocore.exceptions import ClientError # pyright: ignore[reportMissingTypeStubs]
         try:
-            obj = self.s3.get_object(Bucket=self.bucket, Key=key) # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
-            body = obj["Body"].read() # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
-            return PILImage.open(BytesIO(body)).convert("RGBA") # pyright: ignore[reportUnknownArgumentType]
-        except self.s3.exceptions.NoSuchKey: # pyright: ignore[reportUnknownMemberType]
+            # 큰 객체는 범위 GET을 병렬로 받아 spool에 기록 (전체를 bytes로 복사하지 않음)
+            with tempfile.SpooledTemporaryFile(max_size=S3_SPOOL_MAX_BYTES) as buf:
+                self.s3.download_fileobj(self.bucket, key, buf, Config=self.transfer_config) # pyright: ignore[reportUnknownMemberType]
+                buf.seek(0)
+                return PILImage.open(buf).convert("RGBA")
+        except ClientError as e: # pyright: ignore[reportUnknownVariableType]
             from fastapi import HTTPException
-            raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"): # pyright: ignore[reportUnknownMemberType]
+                raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+            raise HTTPException(status_code=500, detail="이미지 로드 실패")
         except Exception:
             from fastapi import HTTPException
             raise HTTPException(status_code=500, detail="이미지 로드 실패")
 
+    def load_bytes(self, filename: str, target: Target = "upload") -> bytes:
+        key = self._key(target, filename)
+        from botocore.exceptions import ClientError # pyright: ignore[reportMissingTypeStubs]
+        try:
+            buf = BytesIO()
+            self.s3.download_fileobj(self.bucket, key, buf, Config=self.transfer_config) # pyright: ignore[reportUnknownMemberType]
+            return buf.getvalue()
+        except ClientError as e: # pyright: ignore[reportUnknownVariableType]
+            from fastapi import HTTPException
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"): # pyright: ignore[reportUnknownMemberType]
+                raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+            raise HTTPException(status_code=500, detail="이미지 로드 실패")
+
+# ---------------- Async ----------------
+class AsyncStorageAdapter:
+    """
+    동기 스토리지(Local/S3)의 블로킹 호출(디스크 I/O, boto3, PNG 인코딩)을 제한된 스레드 풀에서 실행.
+    느린 S3 요청이 있어도 같은 uvicorn 워커의 다른 요청은 계속 처리됨.
+    """
+    def __init__(self, storage: BaseStorage):
+        self.sync = storage
+
+    async def save_png(self, img: PILImage.Image, filename: str, target: Target = "upload") -> None:
+        await run_blocking(self.sync.save_png, img, filename, target)
+
+    async def save_bytes(self, data: bytes, filename: str, target: Target = "upload") -> None:
+        await run_blocking(self.sync.save_bytes, data, filename, target)
+
+    async def save_image(self, img: PILImage.Image, stem: str, target: Target = "upload") -> str:
+        return await run_blocking(self.sync.save_image, img, stem, target)
+
+    async def get_image_response(self, filename: str, target: Target, if_none_match: Optional[str] = None) -> Response:
+        return await run_blocking(self.sync.get_image_response, filename, target, if_none_match)
+
+    async def load_image(self, filename: str, target: Target = "upload") -> PILImage.Image:
+        return await run_blocking(self.sync.load_image, filename, target)
+
 # --------------- Factory ----------------
+@lru_cache(maxsize=1)
 def build_storage() -> BaseStorage:
+    """
+    프로세스당 하나의 스토리지 (모든 모듈이 같은 S3 클라이언트/URL 캐시를 공유).
+    STORAGE_CACHE_ENABLED=true면 메모리/디스크 캐시 계층(CachedStorage)으로 감쌈 (워커용).
+    """
+    storage = _build_backend_storage()
+    if (os.getenv("STORAGE_CACHE_ENABLED") or "false").lower() != "true":
+        return storage
+
+    from app.utils.storage_cache import CachedStorage
+    mb = 1024 * 1024
+    return CachedStorage(
+        storage,
+        memory_max_bytes=int(os.getenv("STORAGE_CACHE_MEMORY_MB") or "256") * mb,
+        # 로컬 스토리지는 이미 디스크에 있으므로 디스크 계층은 S3일 때만
+        disk_dir=os.getenv("STORAGE_CACHE_DIR") or "/tmp/tmoji-image-cache",
+        disk_max_bytes=int(os.getenv("STORAGE_CACHE_DISK_MB") or "2048") * mb if isinstance(storage, S3Storage) else 0,
+    )
+
+def _build_backend_storage() -> BaseStorage:
     backend = os.getenv("ENV_MODE", "local").lower()
     if backend == "prod":
         bucket = os.getenv("S3_BUCKET_NAME") or ""
         region = os.getenv("AWS_REGION") or ""
         expires = int(os.getenv("S3_PRESIGN_EXPIRES") or "3600")
         endpoint = os.getenv("S3_ENDPOINT_URL") or None
+        url_cache_ttl = int(os.getenv("S3_PRESIGN_CACHE_TTL") or "0") or None
         if not bucket:
             raise RuntimeError("S3_BUCKET_NAME is required when STORAGE_BACKEND=s3")
         return S3Storage(
@@ -169,11 +424,18 @@ def build_storage() -> BaseStorage:
             region=region,
             presign_expires=expires,
             endpoint_url=endpoint,
+            url_cache_ttl=url_cache_ttl,
         )
     else:
         return LocalStorage(
             image_base_dir=IMAGE_BASE_DIR, 
             upload_dir=UPLOAD_DIR, 
             compose_dir=COMPOSE_DIR, 
-            crop_dir=CROP_DIR
+            crop_dir=CROP_DIR,
+            derived_dir=DERIVED_DIR,
+            sidecar_targets=PIXEL_SIDECAR_TARGETS if PIXEL_SIDECAR_ENABLED else None,
+            sidecar_max_bytes=PIXEL_SIDECAR_MAX_BYTES,
         )
+
+def build_async_storage() -> AsyncBaseStorage:
+    return AsyncStorageAdapter(build_storage())
@@ -0,0 +1,201 @@
+from __future__ import annotations
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi.responses import Response
+from PIL import Image as PILImage
+
+from app.utils.storage import BaseStorage, Target
+
+logger = logging.getLogger(__name__)
+
+_LOG_EVERY = 500  # 조회 N회마다 적중률 로그
+
+class CachedStorage:
+    """
+    워커 로컬 2단 캐시를 앞단에 둔 스토리지 (BaseStorage 구현).
+    - 메모리 계층: 디코드된 RGBA 이미지 LRU (프로세스별, 픽셀 바이트 기준 용량 제한)
+    - 디스크 계층: 원본 바이트 LRU (같은 호스트의 prefork 자식끼리 공유, mtime 기준 축출)
+    같은 원본을 여러 단계(OCR/합성/파생)에서 다시 읽을 때 S3 다운로드와 디코드를 건너뜀.
+    저장 계열 메서드는 그대로 위임하고, 같은 키의 캐시 항목은 무효화.
+    """
+    def __init__(
+        self,
+        inner: BaseStorage,
+        memory_max_bytes: int = 256 * 1024 * 1024,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 0,
+    ):
+        self.inner = inner
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_bytes = disk_max_bytes if disk_dir else 0
+        self.disk_dir = Path(disk_dir) if disk_dir and self.disk_max_bytes > 0 else None
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+        self._memory: "OrderedDict[str, Tuple[PILImage.Image, int]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "memory_hits": 0, "memory_misses": 0,
+            "disk_hits": 0, "disk_misses": 0,
+        }
+
+    # ---------- 키 ----------
+    def _key(self, filename: str, target: Target) -> str:
+        return f"{target}/{Path(filename).name}"
+
+    def _disk_path(self, key: str) -> Path:
+        assert self.disk_dir is not None
+        return self.disk_dir / hashlib.sha1(key.encode()).hexdigest()
+
+    # ---------- 메모리 계층 ----------
+    def _memory_get(self, key: str) -> Optional[PILImage.Image]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                self._stats["memory_misses"] += 1
+                return None
+            self._memory.move_to_end(key)
+            self._stats["memory_hits"] += 1
+            return entry[0]
+
+    def _memory_put(self, key: str, img: PILImage.Image) -> None:
+        size = img.width * img.height * len(img.getbands())
+        if size > self.memory_max_bytes:
+            return
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old:
+                self._memory_bytes -= old[1]
+            self._memory[key] = (img, size)
+            self._memory_bytes += size
+            while self._memory_bytes > self.memory_max_bytes and self._memory:
+                _, (_, evicted) = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted
+
+    # ---------- 디스크 계층 ----------
+    def _disk_get(self, key: str) -> Optional[bytes]:
+        if self.disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # LRU: 최근 사용 시각 갱신
+        except FileNotFoundError:
+            # 다른 프로세스가 방금 축출했을 수 있음
+            with self._lock:
+                self._stats["disk_misses"] += 1
+            return None
+        with self._lock:
+            self._stats["disk_hits"] += 1
+        return data
+
+    def _disk_put(self, key: str, data: bytes) -> None:
+        if self.disk_dir is None or len(data) > self.disk_max_bytes:
+            return
+        path = self._disk_path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError:
+            logger.exception("storage cache disk write failed (%s)", key)
+            tmp.unlink(missing_ok=True)
+            return
+        self._disk_evict()
+
+    def _disk_evict(self) -> None:
+        assert self.disk_dir is not None
+        entries = []
+        total = 0
+        for p in self.disk_dir.iterdir():
+            if p.name.endswith(".tmp"):
+                continue
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+            total += st.st_size
+        if total <= self.disk_max_bytes:
+            return
+        entries.sort()
+        for _, size, p in entries:
+            if total <= self.disk_max_bytes:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+
+    def _invalidate(self, filename: str, target: Target) -> None:
+        key = self._key(filename, target)
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old:
+                self._memory_bytes -= old[1]
+        if self.disk_dir is not None:
+            self._disk_path(key).unlink(missing_ok=True)
+
+    def _maybe_log(self) -> None:
+        lookups = self._stats["memory_hits"] + self._stats["memory_misses"]
+        if lookups and lookups % _LOG_EVERY == 0:
+            logger.info("storage cache stats: %s", self.stats())
+
+    # ---------- BaseStorage ----------
+    def load_bytes(self, filename: str, target: Target = "upload") -> bytes:
+        key = self._key(filename, target)
+        data = self._disk_get(key)
+        if data is None:
+            data = self.inner.load_bytes(filename, target)
+            self._disk_put(key, data)
+        return data
+
+    def load_image(self, filename: str, target: Target = "upload") -> PILImage.Image:
+        key = self._key(filename, target)
+        img = self._memory_get(key)
+        if img is None:
+            if self.disk_dir is None:
+                img = self.inner.load_image(filename, target)
+            else:
+                img = PILImage.open(BytesIO(self.load_bytes(filename, target))).convert("RGBA")
+            self._memory_put(key, img)
+        self._maybe_log()
+        # 호출측이 이미지에 직접 그리는 경우가 있어 캐시 원본은 공유하지 않음
+        return img.copy()
+
+    def save_png(self, img: PILImage.Image, filename: str, target: Target = "upload") -> None:
+        self.inner.save_png(img, filename, target)
+        self._invalidate(filename, target)
+
+    def save_bytes(self, data: bytes, filename: str, target: Target = "upload") -> None:
+        self.inner.save_bytes(data, filename, target)
+        self._invalidate(filename, target)
+
+    def save_image(self, img: PILImage.Image, stem: str, target: Target = "upload") -> str:
+        filename = self.inner.save_image(img, stem, target)
+        self._invalidate(filename, target)
+        return filename
+
+    def get_image_response(self, filename: str, target: Target, if_none_match: Optional[str] = None) -> Response:
+        return self.inner.get_image_response(filename, target, if_none_match)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            s: Dict[str, Any] = dict(self._stats)
+            s["memory_entries"] = len(self._memory)
+            s["memory_bytes"] = self._memory_bytes
+        for tier in ("memory", "disk"):
+            total = s[f"{tier}_hits"] + s[f"{tier}_misses"]
+            s[f"{tier}_hit_rate"] = round(s[f"{tier}_hits"] / total, 3) if total else None
+        s["disk_enabled"] = self.disk_dir is not None
+        return s
+
+    def __getattr__(self, name: str) -> Any:
+        # S3Storage/LocalStorage 고유 속성(get_path 등)은 내부 스토리지로 위임
+        return getattr(self.inner, name)
@@ -0,0 +1,156 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from PIL import Image as PILImage, ImageDraw, ImageFont
+
+# 측정 전용 1x1 캔버스 (multiline_textbbox 호출용)
+_MEASURE_DRAW = ImageDraw.Draw(PILImage.new("L", (1, 1)))
+
+@dataclass(frozen=True)
+class TextLayout:
+    font: ImageFont.FreeTypeFont
+    text: str  # 줄바꿈(\n)이 반영된 최종 텍스트
+    spacing: int
+    width: int
+    height: int
+
+@lru_cache(maxsize=1024)
+def get_font(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    """(경로, 크기)별 FreeType 폰트 객체를 워커 수명 동안 캐시."""
+    return ImageFont.truetype(font_path, size)
+
+@lru_cache(maxsize=65536)
+def _glyph_metrics(font_path: str, size: int, ch: str) -> Tuple[float, Optional[Tuple[int, int]]]:
+    """글자의 (advance, 세로 범위(top, bottom)). 공백처럼 그려지는 픽셀이 없으면 세로 범위는 None."""
+    font = get_font(font_path, size)
+    left, top, right, bottom = font.getbbox(ch)
+    return font.getlength(ch), ((top, bottom) if right > left and bottom > top else None)
+
+def _text_width(font_path: str, size: int, text: str) -> float:
+    # 글자별 advance 합 (커닝 무시) -> 번역문마다 다른 문자열이어도 글자 단위로 캐시 적중
+    return sum(_glyph_metrics(font_path, size, ch)[0] for ch in text)
+
+@lru_cache(maxsize=1024)
+def _line_step(font_path: str, size: int) -> int:
+    # Pillow multiline_text의 줄 간격(spacing 제외)과 같은 기준
+    return get_font(font_path, size).getbbox("A")[3]
+
+def _block_height(lines: List[str], font_path: str, size: int, spacing: int) -> int:
+    """줄별 글리프 세로 범위를 줄 간격만큼 내려 합친 높이 (multiline_textbbox 높이의 추정)."""
+    step = _line_step(font_path, size) + spacing
+    top: Optional[int] = None
+    bottom: Optional[int] = None
+    for i, line in enumerate(lines):
+        for ch in set(line):
+            extent = _glyph_metrics(font_path, size, ch)[1]
+            if extent is None:
+                continue
+            t, b = i * step + extent[0], i * step + extent[1]
+            top = t if top is None else min(top, t)
+            bottom = b if bottom is None else max(bottom, b)
+    return 0 if top is None or bottom is None else bottom - top
+
+@lru_cache(maxsize=16384)
+def _block_size(font_path: str, size: int, text: str, spacing: int) -> Tuple[int, int]:
+    left, top, right, bottom = _MEASURE_DRAW.multiline_textbbox(
+        (0, 0), text, font=get_font(font_path, size), spacing=spacing
+    )
+    return int(right - left), int(bottom - top)
+
+def _spacing_for(size: int, line_spacing: float) -> int:
+    return max(1, round(size * line_spacing))
+
+def _wrap(text: str, font_path: str, size: int, max_width: int) -> Optional[List[str]]:
+    """
+    단어 단위로 줄바꿈하고, 한 단어가 너무 길면(공백 없는 CJK 포함) 글자 단위로 자름.
+    한 글자도 max_width에 들어가지 않으면 None.
+    """
+    space = _text_width(font_path, size, " ")
+    lines: List[str] = []
+    for paragraph in text.split("\n"):
+        line, line_w = "", 0.0
+        for word in paragraph.split(" "):
+            word_w = _text_width(font_path, size, word)
+            candidate_w = line_w + space + word_w if line else word_w
+            if candidate_w <= max_width:
+                line = f"{line} {word}" if line else word
+                line_w = candidate_w
+                continue
+            if line:
+                lines.append(line)
+                line, line_w = "", 0.0
+            if word_w <= max_width:
+                line, line_w = word, word_w
+                continue
+            for ch in word:
+                ch_w = _text_width(font_path, size, ch)
+                if line_w + ch_w <= max_width:
+                    line += ch
+                    line_w += ch_w
+                elif not line:
+                    return None
+                else:
+                    lines.append(line)
+                    line, line_w = ch, ch_w
+        lines.append(line)
+    return lines
+
+def _fit_text(
+    text: str, max_width: int, max_height: int, font_path: str, size: int, wrap: bool, line_spacing: float
+) -> Optional[str]:
+    """캐시된 글자별 폭/세로 범위로 추정해 박스에 들어가면 줄바꿈이 반영된 텍스트를, 아니면 None 반환."""
+    if wrap:
+        lines = _wrap(text, font_path, size, max_width)
+        if lines is None:
+            return None
+    else:
+        lines = text.split("\n")
+        if max(_text_width(font_path, size, line) for line in lines) > max_width:
+            return None
+    if _block_height(lines, font_path, size, _spacing_for(size, line_spacing)) > max_height:
+        return None
+    return "\n".join(lines)
+
+def _measure(text: str, font_path: str, size: int, line_spacing: float) -> TextLayout:
+    spacing = _spacing_for(size, line_spacing)
+    width, height = _block_size(font_path, size, text, spacing)
+    return TextLayout(font=get_font(font_path, size), text=text, spacing=spacing, width=width, height=height)
+
+def layout_text(
+    text: str,
+    max_width: int,
+    max_height: int,
+    font_path: str,
+    min_font_size: int = 5,
+    max_font_size: int = 100,
+    wrap: bool = True,
+    line_spacing: float = 0.1,
+) -> TextLayout:
+    """
+    텍스트가 max_width x max_height 안에 최대한 꽉 차도록 폰트 크기를 이분 탐색으로 결정.
+    wrap=True면 긴 번역문은 여러 줄로 나눠 배치. 최소 크기로도 넘치면 최소 크기 레이아웃을 반환.
+    탐색은 글자 폭 캐시로 추정하고, 실제 bbox 측정은 고른 크기에서만 수행 (넘치면 한 단계씩 줄임).
+    """
+    best: Optional[int] = None
+    lo, hi = min_font_size, max_font_size
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if _fit_text(text, max_width, max_height, font_path, mid, wrap, line_spacing) is not None:
+            best = mid
+            lo = mid + 1
+        else:
+            hi = mid - 1
+
+    if best is not None:
+        for size in range(best, min_font_size - 1, -1):
+            laid_out = _fit_text(text, max_width, max_height, font_path, size, wrap, line_spacing)
+            if laid_out is None:
+                continue
+            layout = _measure(laid_out, font_path, size, line_spacing)
+            if layout.width <= max_width and layout.height <= max_height:
+                return layout
+
+    lines = _wrap(text, font_path, min_font_size, max_width) if wrap else None
+    return _measure("\n".join(lines) if lines else text, font_path, min_font_size, line_spacing)
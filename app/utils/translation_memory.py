@@ -0,0 +1,68 @@
+from __future__ import annotations
+import hashlib
+import os
+import unicodedata
+from typing import Any, Dict, List, Optional
+
+from app.models.enums.service import Language
+from app.utils.redis_cache import RedisLRUCache
+from app.utils.translator import TranslationBackend
+
+TRANSLATION_MEMORY_NAMESPACE = "tm"
+# 기본: 30일 동안 접근이 없으면 만료, 최대 20만 항목
+TRANSLATION_MEMORY_TTL = int(os.getenv("TRANSLATION_MEMORY_TTL") or str(60 * 60 * 24 * 30))
+TRANSLATION_MEMORY_MAX_ENTRIES = int(os.getenv("TRANSLATION_MEMORY_MAX_ENTRIES") or "200000")
+
+def normalize_text(text: str) -> str:
+    """NFKC 정규화 + 줄 단위 공백 정리 (줄바꿈 자체는 유지)."""
+    text = unicodedata.normalize("NFKC", text)
+    return "\n".join(" ".join(line.split()) for line in text.strip().splitlines())
+
+def _code(lang: Any) -> str:
+    return lang.value if isinstance(lang, Language) else str(lang)
+
+class TranslationMemory:
+    """
+    번역 백엔드 앞단의 번역 메모리.
+    1) 같은 요청 안의 중복 텍스트를 하나로 합치고
+    2) (백엔드, 원문 언어, 대상 언어, 정규화 텍스트) 키로 캐시를 조회한 뒤
+    3) 캐시에 없는 텍스트만 백엔드에 한 번에 보냄.
+    cache가 None이면 중복 제거만 수행.
+    """
+    def __init__(self, backend: TranslationBackend, cache: Optional[RedisLRUCache]):
+        self.backend = backend
+        self.cache = cache
+
+    def _key(self, target: Language, source: Language, text: str) -> str:
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        return f"{self.backend.name}:{_code(source)}:{_code(target)}:{digest}"
+
+    def translate_batch(self, target: Language, source: Language, texts: List[str]) -> List[str]:
+        normalized = [normalize_text(t) for t in texts]
+        unique = list(dict.fromkeys(n for n in normalized if n))
+
+        keys = {n: self._key(target, source, n) for n in unique}
+        cached = self.cache.get_many(list(keys.values())) if self.cache else {}
+        translations: Dict[str, str] = {n: cached[k] for n, k in keys.items() if k in cached}
+
+        misses = [n for n in unique if n not in translations]
+        if misses:
+            translated = self.backend.translate_batch(target, source, misses)
+            translations.update(zip(misses, translated))
+            if self.cache:
+                self.cache.set_many({keys[n]: t for n, t in zip(misses, translated)})
+
+        print(f"[DEBUG] Translation memory: {len(texts)} texts, {len(unique)} unique, {len(misses)} sent to backend")
+        return [translations.get(n, "") for n in normalized]
+
+def _translation_cache() -> RedisLRUCache:
+    return RedisLRUCache(TRANSLATION_MEMORY_NAMESPACE, TRANSLATION_MEMORY_MAX_ENTRIES, TRANSLATION_MEMORY_TTL)
+
+def build_translation_cache() -> Optional[RedisLRUCache]:
+    if (os.getenv("TRANSLATION_MEMORY_ENABLED") or "true").lower() != "true":
+        return None
+    return _translation_cache()
+
+def translation_cache_stats() -> Dict[str, int]:
+    """워커와 같은 namespace의 hit/miss 및 항목 수 (API 헬스체크용, 캐시 비활성화 여부와 무관)."""
+    return _translation_cache().stats()
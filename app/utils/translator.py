@@ -0,0 +1,34 @@
+from __future__ import annotations
+import os
+from typing import List, Protocol
+
+from app.models.enums.service import Language
+
+class TranslationBackend(Protocol):
+    name: str  # 번역 메모리 키에 포함 (백엔드마다 결과가 다르므로 서로의 캐시를 쓰지 않도록)
+    def translate_batch(self, target: Language, source: Language, texts: List[str]) -> List[str]: ...
+
+# ---------------- Google ----------------
+class GoogleTranslationBackend:
+    name = "google"
+
+    def translate_batch(self, target: Language, source: Language, texts: List[str]) -> List[str]:
+        # google-cloud-translate는 google 모드에서만 필요하도록 지연 임포트
+        from app.utils.google_translate import translate_texts
+        return translate_texts(target, source, texts)
+
+# ---------------- Local ----------------
+class LocalTranslationBackend:
+    """네트워크 없이 동작하는 테스트용 백엔드. 원문 앞에 대상 언어 태그만 붙여 반환."""
+    name = "local"
+
+    def translate_batch(self, target: Language, source: Language, texts: List[str]) -> List[str]:
+        target_code = target.value if isinstance(target, Language) else str(target)
+        return [f"[{target_code}] {text}" if text else text for text in texts]
+
+# --------------- Factory ----------------
+def build_translation_backend() -> TranslationBackend:
+    backend = os.getenv("TRANSLATE_BACKEND", "google").lower()
+    if backend == "local":
+        return LocalTranslationBackend()
+    return GoogleTranslationBackend()
@@ -0,0 +1,72 @@
+"""
+OCR 배치 처리량 벤치마크 (영역 crop 기준 areas/s).
+
+영역을 하나씩 predict하는 기존 방식과, crop을 batch_size개씩 묶어 predict하는 방식(_iter_texts_batches)을
+배치 크기별로 비교. Paddle이 설치된 워커 환경에서 실행:
+
+    docker compose exec worker python scripts/bench_ocr.py --areas 64 --batch-sizes 1,4,8,16 --lang en
+"""
+from __future__ import annotations
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.tasks.ocr import _create_ocr, _join_texts  # noqa: E402
+
+def make_crops(count: int, seed: int = 0) -> List[np.ndarray]:
+    """실제 영역과 비슷한 크기의 한 줄/두 줄 텍스트 crop (BGR)."""
+    rng = random.Random(seed)
+    font = ImageFont.load_default(size=28)
+    crops: List[np.ndarray] = []
+    for _ in range(count):
+        lines = [
+            " ".join("".join(rng.choices(string.ascii_letters, k=rng.randint(3, 9))) for _ in range(rng.randint(1, 4)))
+            for _ in range(rng.randint(1, 2))
+        ]
+        img = Image.new("RGB", (rng.randint(180, 480), 48 * len(lines) + 16), "white")
+        ImageDraw.Draw(img).multiline_text((8, 8), "\n".join(lines), fill="black", font=font, spacing=12)
+        crops.append(np.ascontiguousarray(np.asarray(img)[:, :, ::-1]))
+    return crops
+
+def bench_per_area(crops: List[np.ndarray], lang: str) -> float:
+    ocr = _create_ocr(lang, 1)
+    ocr.predict([crops[0]])  # 예열
+    start = time.perf_counter()
+    for crop in crops:
+        [_join_texts(r) for r in ocr.predict([crop])]
+    return len(crops) / (time.perf_counter() - start)
+
+def bench_batched(crops: List[np.ndarray], lang: str, batch_size: int) -> float:
+    ocr = _create_ocr(lang, batch_size)
+    ocr.predict(crops[:batch_size])  # 예열
+    start = time.perf_counter()
+    for i in range(0, len(crops), batch_size):
+        [_join_texts(r) for r in ocr.predict(crops[i:i + batch_size])]
+    return len(crops) / (time.perf_counter() - start)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--areas", type=int, default=64)
+    parser.add_argument("--batch-sizes", default="1,4,8,16")
+    parser.add_argument("--lang", default="en")
+    args = parser.parse_args()
+
+    crops = make_crops(args.areas)
+    baseline = bench_per_area(crops, args.lang)
+    print(f"{'mode':<14}{'areas/s':>10}{'speedup':>10}")
+    print(f"{'per-area':<14}{baseline:>10.2f}{1.0:>10.2f}")
+    for batch_size in [int(b) for b in args.batch_sizes.split(",") if b.strip()]:
+        rate = bench_batched(crops, args.lang, batch_size)
+        print(f"{f'batch={batch_size}':<14}{rate:>10.2f}{rate / baseline:>10.2f}")
+
+if __name__ == "__main__":
+    main()
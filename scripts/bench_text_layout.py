@@ -0,0 +1,105 @@
+"""
+기계 번역 합성 단계의 영역별 텍스트 레이아웃 시간 벤치마크 (ms/area).
+
+폰트 크기를 1씩 올리며 매번 truetype()을 새로 여는 기존 get_resized_font 루프와,
+폰트/측정 캐시 + 이분 탐색을 쓰는 layout_text를 영역이 많은 서비스 여러 개에 대해 비교.
+layout_text는 워커 첫 서비스(cold: 캐시 비움)와 이후 서비스(warm: 캐시 유지)를 나눠 측정.
+PIL만 있으면 되므로 API/워커 어느 컨테이너에서든 실행 가능:
+
+    docker compose exec worker python scripts/bench_text_layout.py --services 5 --areas 200
+"""
+from __future__ import annotations
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from PIL import ImageFont
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.constants.font_path import MACHINE_FONT_PATH  # noqa: E402
+from app.utils import text_layout  # noqa: E402
+
+Area = Tuple[str, int, int]  # (번역문, 박스 너비, 박스 높이)
+
+def get_resized_font(
+    text: str,
+    max_width: int,
+    max_height: int,
+    font_path: str,
+    min_font_size: int = 5,
+    max_font_size: int = 100
+) -> ImageFont.FreeTypeFont:
+    """기존 compose.get_resized_font (비교 기준)."""
+    best_font = ImageFont.truetype(font_path, min_font_size)
+    for font_size in range(min_font_size, max_font_size + 1):
+        font = ImageFont.truetype(font_path, font_size)
+        bbox = font.getbbox(text)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+
+        if text_width > max_width or text_height > max_height:
+            return best_font
+        best_font = font
+
+    return best_font
+
+def make_services(services: int, areas: int, seed: int = 0) -> List[List[Area]]:
+    """말풍선/간판 크기의 박스와 짧은 대사~긴 문장 길이의 번역문."""
+    rng = random.Random(seed)
+
+    def sentence() -> str:
+        return " ".join(
+            "".join(rng.choices(string.ascii_letters, k=rng.randint(2, 9))) for _ in range(rng.randint(1, 16))
+        )
+
+    return [
+        [(sentence(), rng.randint(60, 480), rng.randint(30, 240)) for _ in range(areas)]
+        for _ in range(services)
+    ]
+
+def _clear_layout_caches() -> None:
+    for fn in (text_layout.get_font, text_layout._glyph_metrics, text_layout._line_step, text_layout._block_size):
+        fn.cache_clear()
+
+def _time_per_area(service: List[Area], fn: Callable[[Area], object]) -> float:
+    start = time.perf_counter()
+    for area in service:
+        fn(area)
+    return (time.perf_counter() - start) * 1000 / len(service)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=5)
+    parser.add_argument("--areas", type=int, default=200)
+    parser.add_argument("--font", default=MACHINE_FONT_PATH)
+    args = parser.parse_args()
+
+    services = make_services(args.services, args.areas)
+    # 합성 코드와 같이 박스 안쪽 5px 여백을 뺀 크기로 측정
+    legacy = lambda a: get_resized_font(a[0], a[1] - 10, a[2] - 10, args.font)  # noqa: E731
+    layout = lambda a: text_layout.layout_text(a[0], a[1] - 10, a[2] - 10, args.font)  # noqa: E731
+
+    legacy_ms = [_time_per_area(s, legacy) for s in services]
+    _clear_layout_caches()
+    layout_ms = [_time_per_area(s, layout) for s in services]
+
+    baseline = sum(legacy_ms) / len(legacy_ms)
+    rows = [
+        ("get_resized_font", baseline),
+        ("layout_text cold", layout_ms[0]),
+    ]
+    if len(layout_ms) > 1:
+        rows.append(("layout_text warm", sum(layout_ms[1:]) / len(layout_ms[1:])))
+
+    print(f"{args.services} services x {args.areas} areas")
+    print(f"{'mode':<20}{'ms/area':>10}{'speedup':>10}")
+    for name, ms in rows:
+        print(f"{name:<20}{ms:>10.2f}{baseline / ms:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+import socket
+import time
+
+import pytest
+
+from app.utils.inference import HTTPInferenceBackend
+
+def test_tunnel_without_response_times_out():
+    # 연결은 되지만 응답하지 않는 추론 서버 (SSH direct-tcpip 채널 대신 socketpair 사용)
+    peers = []
+
+    def tunnel(host, port):
+        client, server = socket.socketpair()
+        peers.append(server)
+        return client
+
+    backend = HTTPInferenceBackend("http://127.0.0.1:8000", timeout=0.3, tunnel=tunnel)
+    started = time.monotonic()
+    with pytest.raises(socket.timeout):
+        backend.post("/infer", b"{}", "application/json")
+    assert time.monotonic() - started < 5
+    assert len(peers) == 1  # 타임아웃은 재연결해 재시도하지 않음
+
+    for peer in peers:
+        peer.close()